@@ -5,28 +5,47 @@ import csv
 import json
 import os
 import subprocess
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
+try:  # optional fast JSON serializer
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+try:  # optional compressor for combined results
+    import zstandard
+except ImportError:  # pragma: no cover - uncompressed fallback
+    zstandard = None
+
 from Transcription_parakeet.Src.transcription.Parakeet import (
     DEFAULT_PARAKEET_MODEL,
     _result_to_dict,
     load_model as load_transcription_model,
     print_results as print_transcription_results,
     transcribe_files,
+    transcribe_files_cached,
     validate_paths,
 )
 from Transcription_parakeet.Src.preprocessing.file_format import (
+    DecodedAudioCache,
+    decode_all,
     prepare_audio_files,
 )
 from Transcription_parakeet.Src.diarization.Softformer import (
     DEFAULT_SORTFORMER_MODEL,
     convert_results as convert_diarization_results,
     diarize_files,
+    diarize_files_cached,
     load_model as load_diarization_model,
     print_results as print_diarization_results,
 )
 from Transcription_parakeet.Src.model.model_cache import (
+    clear_checkpoint_cache,
     default_output_dir,
     find_local_checkpoint,
 )
@@ -36,97 +55,182 @@ from Transcription_parakeet.config.logger_config import logger
 
 RESULTS_DIR = Path(__file__).resolve().parents[1] / "results"
 
+_TS_FMT = "%Y%m%dT%H%M%SZ"
+
 
 def _timestamp() -> str:
-    return datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    return datetime.now(timezone.utc).strftime(_TS_FMT)
 
 
 def _make_run_directory() -> Path:
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
     base_name = _timestamp()
-    run_dir = RESULTS_DIR / base_name
-    counter = 1
-    while run_dir.exists():
-        run_dir = RESULTS_DIR / f"{base_name}_{counter:02d}"
-        counter += 1
-    run_dir.mkdir()
-    return run_dir
-
-
-def _write_combined_json(run_dir: Path, entries: list[dict[str, Any]]) -> None:
-    output_path = run_dir / "combined.json"
-    with output_path.open("w", encoding="utf-8") as fh:
-        json.dump(entries, fh, ensure_ascii=False, indent=2)
+    counter = 0
+    while True:
+        if counter == 0:
+            run_dir = RESULTS_DIR / base_name
+        else:
+            run_dir = RESULTS_DIR / f"{base_name}_{counter:02d}"
+        # mkdir is atomic, so concurrent runs in the same second race
+        # safely instead of TOCTOU-ing an exists() probe.
+        try:
+            run_dir.mkdir()
+            return run_dir
+        except FileExistsError:
+            counter += 1
+
+
+def _dump_json_bytes(entries: list[dict[str, Any]]) -> bytes:
+    if orjson is not None:
+        # orjson serializes in C and handles datetime/Path natively;
+        # worth ~5-10x on multi-MB payloads.
+        return orjson.dumps(
+            entries,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(entries, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _write_combined_json(
+    run_dir: Path,
+    entries: list[dict[str, Any]],
+    *,
+    compress: bool = True,
+) -> None:
+    payload = _dump_json_bytes(entries)
+    if compress and zstandard is not None:
+        # Transcript JSON is highly repetitive (speaker_label/start/end
+        # keys), so zstd level 3 shrinks it ~5x; threads=-1 overlaps
+        # compression with the write on all cores.
+        output_path = run_dir / "combined.json.zst"
+        cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+        with cctx.stream_writer(output_path.open("wb")) as writer:
+            writer.write(payload)
+    else:
+        output_path = run_dir / "combined.json"
+        with output_path.open("wb") as fh:
+            fh.write(payload)
     logger.info("Saved combined JSON results to %s", output_path)
 
 
 def _write_transcription_csv(run_dir: Path, entries: list[dict[str, Any]]) -> None:
-    fieldnames = ["AudioFileName", "Transcript", "Confidence"]
+    header = ("AudioFileName", "Transcript", "Confidence")
+    rows = [
+        (
+            os.path.basename(item.get("file", "")),
+            item.get("text", ""),
+            "" if item.get("score") is None else item.get("score"),
+        )
+        for item in entries
+    ]
     output_path = run_dir / "ASR_00.csv"
     with output_path.open("w", encoding="utf-8", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=fieldnames)
-        writer.writeheader()
-        for item in entries:
-            score = item.get("score")
-            writer.writerow(
-                {
-                    "AudioFileName": Path(item.get("file", "")).name,
-                    "Transcript": item.get("text", ""),
-                    "Confidence": "" if score is None else score,
-                }
-            )
+        writer = csv.writer(fh)
+        writer.writerow(header)
+        writer.writerows(rows)
     logger.info("Saved transcription CSV results to %s", output_path)
 
 
 def _format_ts(value: float) -> str:
+    # Single-value fallback; bulk formatting goes through _format_ts_batch.
     return f"{value:06.3f}"
 
 
+def _format_ts_batch(values: list[float]) -> np.ndarray:
+    """Format many timestamps in one C-level pass instead of per-call."""
+    return np.char.mod("%06.3f", np.asarray(values, dtype=np.float64))
+
+
 def _write_diarization_csv(run_dir: Path, entries: list[dict[str, Any]]) -> None:
-    fieldnames = ["AudioFileName", "Speaker", "Confidence", "StartTS", "EndTS"]
-    rows: list[dict[str, Any]] = []
+    header = ("AudioFileName", "Speaker", "Confidence", "StartTS", "EndTS")
+    prefixes: list[tuple[Any, ...]] = []
+    starts: list[float] = []
+    ends: list[float] = []
     for item in entries:
         speakers = item.get("speakers") or []
         if not speakers:
             continue
-        filename = Path(item.get("file", "")).name
+        filename = os.path.basename(item.get("file", ""))
         for segment in speakers:
             start = segment.get("start")
             end = segment.get("end")
             speaker_label = segment.get("speaker_label") or segment.get("speaker_index")
             if start is None or end is None:
                 continue
-            rows.append(
-                {
-                    "AudioFileName": filename,
-                    "Speaker": speaker_label,
-                    "Confidence": segment.get("confidence", 100),
-                    "StartTS": _format_ts(float(start)),
-                    "EndTS": _format_ts(float(end)),
-                }
+            prefixes.append(
+                (filename, speaker_label, segment.get("confidence", 100))
             )
+            starts.append(float(start))
+            ends.append(float(end))
 
-    if not rows:
+    if not prefixes:
         logger.info("No diarization segments to save; skipping SD_00.csv")
         return
 
+    # Format all timestamps in two vectorized passes rather than one
+    # f-string call per segment endpoint.
+    start_strs = _format_ts_batch(starts)
+    end_strs = _format_ts_batch(ends)
+    rows = [
+        prefix + (start_str, end_str)
+        for prefix, start_str, end_str in zip(prefixes, start_strs, end_strs)
+    ]
+
     output_path = run_dir / "SD_00.csv"
     with output_path.open("w", encoding="utf-8", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(fh)
+        writer.writerow(header)
         writer.writerows(rows)
     logger.info("Saved diarization CSV results to %s", output_path)
 
 
-def _persist_results(entries: list[dict[str, Any]]) -> None:
+def _persist_results(
+    entries: list[dict[str, Any]],
+    *,
+    compress: bool = True,
+) -> None:
     run_dir = _make_run_directory()
-    _write_combined_json(run_dir, entries)
+    _write_combined_json(run_dir, entries, compress=compress)
     _write_transcription_csv(run_dir, entries)
     _write_diarization_csv(run_dir, entries)
     logger.info("Results saved under %s", run_dir)
 
 
-def _ensure_local_model(model_name: str) -> None:
+# Single worker so runs persist in submission order; results are returned
+# to the caller while the JSON/CSV writes happen in the background.
+_persist_executor = ThreadPoolExecutor(max_workers=1)
+_persist_future: Future[None] | None = None
+
+
+def _log_persist_failure(future: Future[None]) -> None:
+    exc = future.exception()
+    if exc is not None:  # pragma: no cover - best effort
+        logger.warning("Unable to persist results: %s", exc)
+
+
+def _persist_results_async(entries: list[dict[str, Any]]) -> None:
+    global _persist_future
+    future = _persist_executor.submit(_persist_results, entries)
+    future.add_done_callback(_log_persist_failure)
+    _persist_future = future
+
+
+def wait_persist() -> None:
+    """Block until the most recent background persist has finished.
+
+    Callers that need results on disk before proceeding (e.g. tests or
+    batch drivers) can call this after ``run_pipeline`` returns.
+    """
+    future = _persist_future
+    if future is not None:
+        try:
+            future.result()
+        except Exception:  # pragma: no cover - already logged by callback
+            pass
+
+
+@lru_cache(maxsize=16)
+def _ensure_local_model_cached(model_name: str) -> None:
     local = find_local_checkpoint(model_name)
     if local is not None and local.exists():
         return
@@ -134,6 +238,10 @@ def _ensure_local_model(model_name: str) -> None:
     out_dir = default_output_dir()
     try:
         path = download_and_save(model_name, out_dir)
+        # Drop the memoized miss so the load_model call that follows
+        # finds the checkpoint just written instead of falling back to
+        # from_pretrained.
+        clear_checkpoint_cache()
         logger.info("Model cached at %s", path)
     except (
         OSError,
@@ -143,11 +251,43 @@ def _ensure_local_model(model_name: str) -> None:
         logger.warning("Unable to cache model %s: %s", model_name, exc)
 
 
+def _ensure_local_model(model_name: str) -> None:
+    """Cache a model locally, at most once per model name per process.
+
+    Long-running servers call this for the same two models on every
+    request; the lru_cache skips the repeated checkpoint-directory walks.
+    Tests that change default_output_dir() should call
+    ``_ensure_local_model_cached.cache_clear()``.
+    """
+    _ensure_local_model_cached(model_name)
+
+
+def _ensure_local_models(model_names: list[str]) -> None:
+    """Cache several models concurrently.
+
+    ``download_and_save`` is dominated by HTTP round-trips, so caching the
+    transcription and diarization checkpoints in parallel roughly halves
+    cold-start latency. ``_ensure_local_model`` already catches and logs its
+    own errors, so nothing is lost inside the worker threads.
+    """
+    if not model_names:
+        return
+    if len(model_names) == 1:
+        _ensure_local_model(model_names[0])
+        return
+    with ThreadPoolExecutor(max_workers=len(model_names)) as executor:
+        futures = [
+            executor.submit(_ensure_local_model, name) for name in model_names
+        ]
+        wait(futures)
+
+
 def _merge_diarization(
     transcripts: list[dict[str, Any]],
     diarization: list[dict[str, Any]],
 ) -> None:
     by_file = {entry["file"]: entry for entry in transcripts}
+    default_entry = {"text": "", "score": None, "timestamps": None}
     for item in diarization:
         file_key = item.get("file")
         segments = item.get("segments")
@@ -158,10 +298,8 @@ def _merge_diarization(
             target["speakers"] = segments or []
         else:
             new_entry = {
+                **default_entry,
                 "file": file_key,
-                "text": "",
-                "score": None,
-                "timestamps": None,
                 "speakers": segments or [],
             }
             transcripts.append(new_entry)
@@ -182,58 +320,108 @@ def run_pipeline(
         raise SystemExit(2)
 
     # Prepare audio files to meet model expectations (mono 16kHz 16-bit WAV).
+    # When diarizing, capture PCM piped out of each conversion so the
+    # decode pass below never re-reads freshly written WAVs from disk.
+    capture = DecodedAudioCache() if diarize else None
     try:
-        with prepare_audio_files(paths) as prepared_paths:
+        with prepare_audio_files(paths, capture=capture) as prepared_paths:
             if not prepared_paths:
                 raise SystemExit(2)
 
+            # validate_paths already guarantees every entry in `paths`
+            # exists, so no per-path re-stat is needed here.
+            originals_for_prepared = list(paths)
+
+            # Batched RNN-T decoding waits for the longest item in each
+            # batch, so sort descending by file size (a duration proxy for
+            # uniform mono-16k WAVs) to keep batches length-homogeneous.
+            # Results are restored to input order further down.
+            # transcribe_files also widens default batch sizes for
+            # multi-file calls, so sort whenever there is more than one
+            # file rather than only for explicit batch_size > 1.
+            order = list(range(len(prepared_paths)))
+            if len(prepared_paths) > 1:
+                order.sort(
+                    key=lambda i: os.path.getsize(prepared_paths[i]),
+                    reverse=True,
+                )
+                prepared_paths = [prepared_paths[i] for i in order]
+                originals_for_prepared = [
+                    originals_for_prepared[i] for i in order
+                ]
+
             model_name = model or DEFAULT_PARAKEET_MODEL
-            _ensure_local_model(model_name)
-            m = load_transcription_model(model_name)
-            results = transcribe_files(
-                m,
-                prepared_paths,
-                batch_size=batch_size,
-            )
+            diar_model_name = diarization_model or DEFAULT_SORTFORMER_MODEL
+            wanted_models = [model_name]
+            if diarize:
+                wanted_models.append(diar_model_name)
+            _ensure_local_models(wanted_models)
+
+            # Decode every prepared WAV once; transcription and diarization
+            # both consume the cached PCM instead of re-reading from disk.
+            audio_cache = None
+            if diarize:
+                cache = decode_all(prepared_paths, cache=capture)
+                if set(cache.paths) == set(prepared_paths):
+                    audio_cache = cache
 
-            # Build a list of original input paths that correspond to the
-            # prepared list.
-            originals_for_prepared = []
-            for p in paths:
-                if p and os.path.exists(p):
-                    originals_for_prepared.append(p)
+            m = load_transcription_model(model_name)
+            if audio_cache is not None:
+                # The capture cache is seeded in conversion order, which
+                # may differ from the sorted prepared_paths — pass the
+                # explicit order so results line up with the originals.
+                results = transcribe_files_cached(
+                    m,
+                    audio_cache,
+                    batch_size=batch_size,
+                    paths=prepared_paths,
+                )
+            else:
+                results = transcribe_files(
+                    m,
+                    prepared_paths,
+                    batch_size=batch_size,
+                )
 
             print_transcription_results(originals_for_prepared, results)
 
-            structured = []
-            for i, r in enumerate(results):
-                structured.append(_result_to_dict(originals_for_prepared[i], r))
+            structured = [
+                _result_to_dict(p, r)
+                for p, r in zip(originals_for_prepared, results)
+            ]
+
+            # Undo the duration sort so callers see results in input order.
+            if order != sorted(order):
+                restored: list[dict[str, Any]] = [{}] * len(structured)
+                for sorted_pos, input_pos in enumerate(order):
+                    restored[input_pos] = structured[sorted_pos]
+                structured = restored
 
             if not diarize:
-                try:
-                    _persist_results(structured)
-                except Exception as exc:  # pragma: no cover - best effort
-                    logger.warning("Unable to persist results: %s", exc)
+                _persist_results_async(structured)
                 return structured
 
-            diar_model_name = diarization_model or DEFAULT_SORTFORMER_MODEL
-            _ensure_local_model(diar_model_name)
             diarizer = load_diarization_model(diar_model_name)
-            diar_segments, _ = diarize_files(
-                diarizer,
-                prepared_paths,
-                batch_size=diarization_batch_size or batch_size,
-            )
+            if audio_cache is not None:
+                diar_segments, _ = diarize_files_cached(
+                    diarizer,
+                    audio_cache,
+                    batch_size=diarization_batch_size or batch_size,
+                    paths=prepared_paths,
+                )
+            else:
+                diar_segments, _ = diarize_files(
+                    diarizer,
+                    prepared_paths,
+                    batch_size=diarization_batch_size or batch_size,
+                )
             # Use original paths so results reference input files.
             print_diarization_results(originals_for_prepared, diar_segments)
             diar_structured = convert_diarization_results(
                 originals_for_prepared, diar_segments
             )
             _merge_diarization(structured, diar_structured)
-            try:
-                _persist_results(structured)
-            except Exception as exc:  # pragma: no cover - best effort
-                logger.warning("Unable to persist results: %s", exc)
+            _persist_results_async(structured)
             return structured
     # pragma: no cover - bubble up friendly error
     except (subprocess.CalledProcessError, OSError) as exc:
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import os
 import shutil
+import tarfile
+import tempfile
+import zipfile
 from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 import importlib
 
-DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB
+# Stream-to-disk chunk size. 8 MiB cuts syscalls on big archives; the env
+# var lets low-memory environments dial it down without code changes.
+DOWNLOAD_CHUNK_BYTES = int(
+    os.environ.get("DATASET_DOWNLOAD_CHUNK_BYTES", 1 << 23)
+)
+DEFAULT_CHUNK_SIZE = DOWNLOAD_CHUNK_BYTES
 
 
 class DatasetDownloadError(RuntimeError):
@@ -30,6 +39,155 @@ class DownloadResult:
         return payload
 
 
+def iter_files(root: Path) -> Iterator[str]:
+    """Yield every file path under ``root`` using os.scandir recursion.
+
+    Several times faster than ``Path.rglob`` on large trees: DirEntry
+    type checks come from the readdir data already in hand, and no
+    intermediate Path objects are allocated.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry.path
+        except OSError:  # pragma: no cover - unreadable subtree
+            continue
+
+
+def count_files(root: Path) -> int:
+    """Count files under ``root`` without materializing a path list."""
+    return sum(1 for _ in iter_files(root))
+
+
+# ZIP bodies streamed for extraction are buffered in RAM up to this size
+# (the central directory needs a seekable object); larger archives spill
+# to an anonymous temp file.
+ARCHIVE_SPOOL_MAX_BYTES = 64 << 20
+
+_ARCHIVE_SUFFIXES = (".zip", ".tar", ".gz", ".tgz", ".bz2", ".txz", ".xz")
+
+
+def is_archive_name(name: str) -> bool:
+    """Return True when ``name`` looks like an extractable archive."""
+    return name.lower().endswith(_ARCHIVE_SUFFIXES)
+
+
+def extract_stream(fileobj: Any, name: str, destination: Path) -> None:
+    """Extract an archive directly from a readable stream.
+
+    Avoids landing the archive on disk and re-reading it: tars extract in
+    a single forward pass (``r|*``), zips spool through RAM (disk only
+    past ``ARCHIVE_SPOOL_MAX_BYTES``) because the format requires seeking
+    to the central directory.
+    """
+    destination.mkdir(parents=True, exist_ok=True)
+    if name.lower().endswith(".zip"):
+        with tempfile.SpooledTemporaryFile(
+            max_size=ARCHIVE_SPOOL_MAX_BYTES
+        ) as spool:
+            shutil.copyfileobj(fileobj, spool, length=DEFAULT_CHUNK_SIZE)
+            spool.seek(0)
+            with zipfile.ZipFile(spool) as archive:
+                archive.extractall(destination)
+        return
+    with tarfile.open(fileobj=fileobj, mode="r|*") as tar_ref:
+        for member in tar_ref:
+            tar_ref.extract(member, destination, filter="data")
+
+
+# Linux FICLONE ioctl: ask the filesystem for a copy-on-write clone.
+_FICLONE = 0x40049409
+
+
+def _try_reflink(src: str, dst: str) -> bool:
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - non-POSIX platform
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        return True
+    except OSError:
+        # Clone unsupported (filesystem/kernel); drop the empty target so
+        # the fallback copy starts clean.
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+        return False
+
+
+def _kernel_copyfile(src: str, dst: str) -> bool:
+    """Copy file bytes without surfacing them in user space.
+
+    ``copy_file_range`` moves data inside the kernel (and can go
+    offloaded/server-side on NFS); ``sendfile`` is the older equivalent.
+    Returns False when neither syscall is usable so the caller can fall
+    back to a read/write copy.
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    sendfile = getattr(os, "sendfile", None)
+    if copy_range is None and sendfile is None:  # pragma: no cover
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            offset = 0
+            while remaining > 0:
+                if copy_range is not None:
+                    moved = copy_range(
+                        fsrc.fileno(), fdst.fileno(), remaining
+                    )
+                else:
+                    moved = sendfile(
+                        fdst.fileno(), fsrc.fileno(), offset, remaining
+                    )
+                    offset += moved
+                if moved == 0:
+                    break
+                remaining -= moved
+            return remaining == 0
+    except OSError:
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+        return False
+
+
+def fast_copy(src: Any, dst: Any, *, copy_mode: str = "auto") -> None:
+    """Copy a file using the cheapest mechanism the platform offers.
+
+    ``auto``/``reflink`` first attempt a copy-on-write clone (free on
+    btrfs/XFS/APFS), ``hardlink`` links the inode when src and dst share a
+    filesystem, then data is moved in-kernel via copy_file_range/sendfile,
+    with ``shutil.copy2`` as the portable last resort.
+    """
+    if copy_mode not in {"auto", "reflink", "hardlink", "copy"}:
+        raise ValueError(f"Unknown copy_mode '{copy_mode}'.")
+    src_s, dst_s = str(src), str(dst)
+    if copy_mode == "hardlink":
+        try:
+            os.link(src_s, dst_s)
+            return
+        except OSError:
+            pass  # cross-device or unsupported; fall through to copying
+    if copy_mode in {"auto", "reflink"} and _try_reflink(src_s, dst_s):
+        shutil.copystat(src_s, dst_s)
+        return
+    if _kernel_copyfile(src_s, dst_s):
+        shutil.copystat(src_s, dst_s)
+        return
+    shutil.copy2(src_s, dst_s)
+
+
 def ensure_destination(path: Path, overwrite: bool = False) -> Path:
     """Ensure a clean destination directory for a download."""
     if path.exists():
@@ -64,12 +222,76 @@ def require_requests() -> Any:
     return _load_requests()
 
 
+@lru_cache(maxsize=1)
+def get_shared_session() -> Any:
+    """Return the process-wide pooled ``requests.Session``.
+
+    One session shared by every downloader amortizes TCP+TLS handshakes
+    across calls; the mounted adapters raise the default pool limits so
+    concurrent downloads to the same host do not serialize. Callers must
+    not close the returned session.
+    """
+    requests = _load_requests()
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        pool_block=False,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def stream_response_to_file(response: Any, target_path: Path) -> Path:
-    """Persist a streaming HTTP response to disk."""
+    """Persist a streaming HTTP response to disk.
+
+    Writes through a raw file descriptor and, where supported, hints the
+    kernel that access is sequential and that written pages need not stay
+    cached — multi-GB archives otherwise evict the rest of the page cache.
+    """
     require_requests()
     target_path.parent.mkdir(parents=True, exist_ok=True)
+    fadvise = getattr(os, "posix_fadvise", None)
+    fallocate = getattr(os, "posix_fallocate", None)
+    raw = getattr(response, "raw", None)
+    try:
+        expected_size = int(response.headers.get("Content-Length", 0) or 0)
+    except (AttributeError, TypeError, ValueError):
+        expected_size = 0
     with target_path.open("wb") as handle:
-        for chunk in response.iter_content(DEFAULT_CHUNK_SIZE):
-            if chunk:
-                handle.write(chunk)
+        fd = handle.fileno()
+        if fallocate is not None and expected_size > 0:
+            # Reserving the advertised size up front keeps multi-GB
+            # downloads in contiguous extents and cuts journal traffic
+            # from repeated extent allocations.
+            try:
+                fallocate(fd, 0, expected_size)
+            except OSError:  # pragma: no cover - fs without fallocate
+                pass
+        if fadvise is not None:
+            fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if raw is not None:
+            # copyfileobj loops in C; decode_content keeps gzip/deflate
+            # transfer encodings transparent like iter_content did.
+            raw.decode_content = True
+            shutil.copyfileobj(raw, handle, length=DEFAULT_CHUNK_SIZE)
+        else:  # pragma: no cover - non-requests response objects
+            for chunk in response.iter_content(DEFAULT_CHUNK_SIZE):
+                if chunk:
+                    handle.write(chunk)
+        handle.flush()
+        if expected_size > 0:
+            # Content-Length counts wire bytes; with transfer decoding the
+            # decoded stream can differ, so trim any reserved tail.
+            handle.truncate()
+        if fadvise is not None:
+            fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
     return target_path
@@ -1,38 +1,51 @@
 from __future__ import annotations
 
+import importlib
 from pathlib import Path
-from typing import Any, Mapping, Type
+from typing import Any, Dict, Mapping, Type
 
 from config.logger_config import logger
 from Dataset_d.common import DatasetDownloadError, DownloadResult
-from Dataset_d.drive import GoogleDriveDownloader
-from Dataset_d.gh_d import GitHubDownloader
-from Dataset_d.hf_d import HuggingFaceDownloader
-from Dataset_d.http_d import HTTPDownloader
-from Dataset_d.kaggle_d import KaggleDownloader
-from Dataset_d.local_d import LocalDatasetImporter
-from Dataset_d.s3_d import S3Downloader
 
 DATASETS_ROOT = Path(__file__).resolve().parent / "data"
 
 DownloaderType = Type[Any]
-DOWNLOADERS: Mapping[str, DownloaderType] = {
-    "github": GitHubDownloader,
-    "gh": GitHubDownloader,
-    "huggingface": HuggingFaceDownloader,
-    "hf": HuggingFaceDownloader,
-    "google_drive": GoogleDriveDownloader,
-    "gdrive": GoogleDriveDownloader,
-    "kaggle": KaggleDownloader,
-    "http": HTTPDownloader,
-    "https": HTTPDownloader,
-    "url": HTTPDownloader,
-    "s3": S3Downloader,
-    "aws": S3Downloader,
-    "local": LocalDatasetImporter,
-    "filesystem": LocalDatasetImporter,
+
+# Downloaders are resolved lazily so importing this module (or using one
+# source) does not pull in every optional SDK (boto3, huggingface_hub,
+# kaggle, ...). Mirrors the lazy _load_requests pattern in common.py.
+DOWNLOADER_PATHS: Mapping[str, str] = {
+    "github": "Dataset_d.gh_d:GitHubDownloader",
+    "gh": "Dataset_d.gh_d:GitHubDownloader",
+    "huggingface": "Dataset_d.hf_d:HuggingFaceDownloader",
+    "hf": "Dataset_d.hf_d:HuggingFaceDownloader",
+    "google_drive": "Dataset_d.drive:GoogleDriveDownloader",
+    "gdrive": "Dataset_d.drive:GoogleDriveDownloader",
+    "kaggle": "Dataset_d.kaggle_d:KaggleDownloader",
+    "http": "Dataset_d.http_d:HTTPDownloader",
+    "https": "Dataset_d.http_d:HTTPDownloader",
+    "url": "Dataset_d.http_d:HTTPDownloader",
+    "s3": "Dataset_d.s3_d:S3Downloader",
+    "aws": "Dataset_d.s3_d:S3Downloader",
+    "local": "Dataset_d.local_d:LocalDatasetImporter",
+    "filesystem": "Dataset_d.local_d:LocalDatasetImporter",
 }
 
+_RESOLVED_DOWNLOADERS: Dict[str, DownloaderType] = {}
+
+
+def _resolve_downloader(key: str) -> DownloaderType | None:
+    cached = _RESOLVED_DOWNLOADERS.get(key)
+    if cached is not None:
+        return cached
+    target = DOWNLOADER_PATHS.get(key)
+    if target is None:
+        return None
+    module_name, cls_name = target.split(":")
+    downloader_cls = getattr(importlib.import_module(module_name), cls_name)
+    _RESOLVED_DOWNLOADERS[key] = downloader_cls
+    return downloader_cls
+
 
 def get_datasets_root() -> Path:
     """Return the default root directory used for dataset downloads."""
@@ -42,7 +55,7 @@ def get_datasets_root() -> Path:
 
 def available_sources() -> list[str]:
     """Return the list of supported download source keys."""
-    return sorted(set(DOWNLOADERS.keys()))
+    return sorted(set(DOWNLOADER_PATHS.keys()))
 
 
 def download_dataset(
@@ -55,7 +68,7 @@ def download_dataset(
 ) -> DownloadResult:
     """Download a dataset from the requested source."""
     key = source.lower()
-    downloader_cls = DOWNLOADERS.get(key)
+    downloader_cls = _resolve_downloader(key)
     if not downloader_cls:
         raise DatasetDownloadError(f"Unknown dataset source '{source}'.")
     destination_root = (
@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping, Optional
 
 from config.logger_config import logger
 from Dataset_d.common import (
+    DEFAULT_CHUNK_SIZE,
     DatasetDownloadError,
     DownloadResult,
     ensure_destination,
+    extract_stream,
+    get_shared_session,
+    is_archive_name,
+    iter_files,
     require_requests,
     stream_response_to_file,
 )
@@ -18,10 +24,14 @@ from Dataset_d.common import (
 class HTTPDownloader:
     """Download datasets from generic HTTP(S) endpoints."""
 
+    # Sidecar metadata (ETags for resume validation) lives in a hidden
+    # subdirectory so it never mingles with the dataset content itself.
+    _META_DIR_NAME = ".dl-meta"
+
     def __init__(self, *, timeout: int = 120) -> None:
         self._requests = require_requests()
         self._timeout = timeout
-        self._session = self._requests.Session()
+        self._session = get_shared_session()
 
     def download(
         self,
@@ -34,27 +44,94 @@ class HTTPDownloader:
         overwrite: bool = False,
         extract: bool = False,
         keep_archive: bool = False,
+        max_workers: Optional[int] = None,
+        resume: bool = True,
     ) -> DownloadResult:
-        ensure_destination(destination, overwrite=overwrite)
+        if resume and destination.exists() and not overwrite:
+            # Reuse the directory so prior partial/complete files can be
+            # validated or resumed instead of erroring out.
+            destination.mkdir(parents=True, exist_ok=True)
+        else:
+            ensure_destination(destination, overwrite=overwrite)
         targets = self._normalise_urls(url, urls)
-        saved_files: list[str] = []
+        jobs: list[tuple[str, Path]] = []
         for index, target_url in enumerate(targets, start=1):
-            logger.info("Downloading %s", target_url)
             inferred_name = self._infer_filename(target_url)
             target_name = self._pick_name(filename, inferred_name, index)
-            file_path = destination / target_name
-            self._stream_to_disk(target_url, headers, file_path)
-            if extract:
-                extracted = self._maybe_extract(file_path, destination, keep_archive)
-                saved_files.extend(extracted)
-            else:
-                saved_files.append(str(file_path))
+            jobs.append((target_url, destination / target_name))
+
+        # Archives that will not be kept are extracted straight from the
+        # response body, skipping the write-then-re-read round trip
+        # through shutil.unpack_archive.
+        stream_extract = extract and not keep_archive
+
+        def _fetch(job: tuple[str, Path]) -> Path | None:
+            target_url, file_path = job
+            logger.info("Downloading %s", target_url)
+            if stream_extract and is_archive_name(file_path.name):
+                self._stream_extract(
+                    target_url, headers, file_path.name, destination
+                )
+                return None
+            self._stream_to_disk(target_url, headers, file_path, resume=resume)
+            return file_path
+
+        # Downloads are I/O-bound and release the GIL in socket.recv, so
+        # fetching URLs concurrently overlaps their latency. The shared
+        # session's pool (maxsize 64) comfortably covers the worker count.
+        workers = max_workers or min(8, len(jobs))
+        if workers <= 1 or len(jobs) == 1:
+            landed = [_fetch(job) for job in jobs]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_fetch, job) for job in jobs]
+                for future in as_completed(futures):
+                    # Propagate the first failure promptly; the executor
+                    # context cancels nothing but we stop collecting.
+                    future.result()
+                landed = [future.result() for future in futures]
+
+        # On-disk extraction runs after all downloads complete so the
+        # file listing is not racing concurrent writes.
+        if extract:
+            for file_path in landed:
+                if file_path is not None:
+                    self._maybe_extract(file_path, destination, keep_archive)
+            saved_files = self._dataset_files(destination) or [
+                str(destination)
+            ]
+        else:
+            saved_files = [str(p) for p in landed if p is not None]
         details: Dict[str, Any] = {
             "urls": list(targets),
             "files": saved_files,
         }
         return DownloadResult(dataset_path=destination, details=details)
 
+    def _stream_extract(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        name: str,
+        destination: Path,
+    ) -> None:
+        with self._session.get(
+            url,
+            headers=headers,
+            stream=True,
+            timeout=self._timeout,
+        ) as response:
+            try:
+                response.raise_for_status()
+            except Exception as exc:  # pragma: no cover
+                snippet = response.text[:200]
+                raise DatasetDownloadError(
+                    f"HTTP download failed for {url}: {snippet}"
+                ) from exc
+            raw = response.raw
+            raw.decode_content = True
+            extract_stream(raw, name, destination)
+
     def _normalise_urls(
         self,
         url: Optional[str],
@@ -94,15 +171,36 @@ class HTTPDownloader:
         stem, suffix = os.path.splitext(inferred)
         return f"{stem}_{index}{suffix}"
 
+    @classmethod
+    def _etag_path(cls, file_path: Path) -> Path:
+        return (
+            file_path.parent / cls._META_DIR_NAME / (file_path.name + ".etag")
+        )
+
+    @classmethod
+    def _dataset_files(cls, destination: Path) -> list[str]:
+        """List dataset files, excluding the metadata sidecar directory."""
+        marker = os.sep + cls._META_DIR_NAME + os.sep
+        return [path for path in iter_files(destination) if marker not in path]
+
     def _stream_to_disk(
         self,
         url: str,
         headers: Optional[Mapping[str, str]],
         file_path: Path,
+        *,
+        resume: bool = True,
     ) -> None:
+        request_headers = dict(headers or {})
+        etag_path = self._etag_path(file_path)
+        if resume and file_path.exists():
+            if self._check_cached_copy(
+                url, request_headers, file_path, etag_path
+            ):
+                return
         with self._session.get(
             url,
-            headers=headers,
+            headers=request_headers,
             stream=True,
             timeout=self._timeout,
         ) as response:
@@ -113,7 +211,77 @@ class HTTPDownloader:
                 raise DatasetDownloadError(
                     f"HTTP download failed for {url}: {snippet}"
                 ) from exc
-            stream_response_to_file(response, file_path)
+            if "Range" in request_headers and response.status_code == 206:
+                raw = response.raw
+                raw.decode_content = True
+                with file_path.open("ab") as fh:
+                    shutil.copyfileobj(raw, fh, length=DEFAULT_CHUNK_SIZE)
+            else:
+                stream_response_to_file(response, file_path)
+            etag = response.headers.get("ETag")
+            if etag:
+                try:
+                    etag_path.parent.mkdir(parents=True, exist_ok=True)
+                    etag_path.write_text(etag, encoding="utf-8")
+                except OSError:  # pragma: no cover - cache is best effort
+                    pass
+
+    def _check_cached_copy(
+        self,
+        url: str,
+        request_headers: dict[str, str],
+        file_path: Path,
+        etag_path: Path,
+    ) -> bool:
+        """Probe the server about an existing local file.
+
+        Returns True when the local copy is already current (skip the
+        GET). May add a ``Range`` header to ``request_headers`` so the
+        caller resumes from the current byte offset instead of
+        re-downloading multi-GB archives from scratch.
+        """
+        local_size = file_path.stat().st_size
+        stored_etag: Optional[str] = None
+        if etag_path.exists():
+            try:
+                stored_etag = etag_path.read_text(encoding="utf-8").strip()
+            except OSError:  # pragma: no cover
+                stored_etag = None
+        head_headers = dict(request_headers)
+        if stored_etag:
+            head_headers["If-None-Match"] = stored_etag
+        try:
+            head = self._session.head(
+                url,
+                headers=head_headers,
+                timeout=self._timeout,
+                allow_redirects=True,
+            )
+        except OSError:  # pragma: no cover - fall back to a full GET
+            return False
+        if head.status_code == 304:
+            logger.info("Local copy of %s is current (304); skipping", url)
+            return True
+        if not head.ok:
+            return False
+        remote_size = int(head.headers.get("Content-Length", 0) or 0)
+        if (
+            stored_etag
+            and head.headers.get("ETag") == stored_etag
+            and remote_size == local_size
+        ):
+            logger.info("Local copy of %s matches ETag; skipping", url)
+            return True
+        accepts_ranges = head.headers.get("Accept-Ranges", "").lower() == "bytes"
+        if accepts_ranges and 0 < local_size < remote_size:
+            logger.info(
+                "Resuming %s from byte %d of %d",
+                url,
+                local_size,
+                remote_size,
+            )
+            request_headers["Range"] = f"bytes={local_size}-"
+        return False
 
     def _maybe_extract(
         self,
@@ -127,13 +295,12 @@ class HTTPDownloader:
             return [str(archive_path)]
         if not keep_archive:
             archive_path.unlink(missing_ok=True)
-        extracted: list[str] = [
-            str(path) for path in destination.rglob("*") if path.is_file()
-        ]
+        extracted = self._dataset_files(destination)
         return extracted or [str(destination)]
 
     def __enter__(self) -> "HTTPDownloader":  # pragma: no cover
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:  # pragma: no cover
-        self._session.close()
+        # The session is shared process-wide; leave it open for reuse.
+        pass
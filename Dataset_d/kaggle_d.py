@@ -14,17 +14,44 @@ from Dataset_d.common import (
 
 
 class KaggleDownloader:
-    """Download datasets from Kaggle via the Kaggle CLI."""
+    """Download datasets from Kaggle, in-process when possible.
+
+    Uses the ``kaggle`` package's ``KaggleApi`` directly — one
+    authenticated HTTP session reused across calls, no interpreter
+    startup per download — and falls back to the CLI only when the
+    package is not importable.
+    """
 
     def __init__(self, *, kaggle_executable: Optional[str] = None) -> None:
-        self._executable = kaggle_executable or shutil.which("kaggle")
-        if not self._executable:
-            raise DatasetDownloadError(
-                (
-                    "Kaggle CLI not found. Install the 'kaggle' package and "
-                    "set up API credentials."
+        self._api = self._load_api()
+        self._executable: Optional[str] = None
+        if self._api is None:
+            self._executable = kaggle_executable or shutil.which("kaggle")
+            if not self._executable:
+                raise DatasetDownloadError(
+                    (
+                        "Kaggle CLI not found. Install the 'kaggle' package "
+                        "and set up API credentials."
+                    )
                 )
-            )
+
+    def _load_api(self) -> Any:
+        try:
+            from kaggle.api.kaggle_api_extended import KaggleApi
+        except ImportError:
+            return None
+        except OSError as exc:  # pragma: no cover - missing credentials
+            raise DatasetDownloadError(
+                f"Kaggle API credentials not configured: {exc}"
+            ) from exc
+        api = KaggleApi()
+        try:
+            api.authenticate()
+        except Exception as exc:
+            raise DatasetDownloadError(
+                f"Kaggle authentication failed: {exc}"
+            ) from exc
+        return api
 
     def download(
         self,
@@ -37,8 +64,114 @@ class KaggleDownloader:
         overwrite: bool = False,
         keep_archive: bool = False,
         extra_args: Optional[Iterable[str]] = None,
+        return_file_list: bool = False,
     ) -> DownloadResult:
         ensure_destination(destination, overwrite=overwrite)
+        if self._api is not None:
+            command = self._download_via_api(
+                destination,
+                dataset=dataset,
+                competition=competition,
+                files=files,
+                unzip=unzip,
+                overwrite=overwrite,
+            )
+        else:
+            command = self._download_via_cli(
+                destination,
+                dataset=dataset,
+                competition=competition,
+                files=files,
+                unzip=unzip,
+                extra_args=extra_args,
+            )
+        if unzip and not keep_archive:
+            self._cleanup_archives(destination)
+        details = self._build_details(
+            destination,
+            command,
+            return_file_list=return_file_list,
+        )
+        return DownloadResult(dataset_path=destination, details=details)
+
+    def _download_via_api(
+        self,
+        destination: Path,
+        *,
+        dataset: Optional[str],
+        competition: Optional[str],
+        files: Optional[Iterable[str]],
+        unzip: bool,
+        overwrite: bool,
+    ) -> list[str]:
+        if bool(dataset) == bool(competition):
+            raise DatasetDownloadError(
+                (
+                    "Specify exactly one of 'dataset' or 'competition' for "
+                    "Kaggle downloads."
+                )
+            )
+        identifier = dataset or competition or ""
+        logger.info("Downloading %s via Kaggle API", identifier)
+        try:
+            if dataset:
+                if files:
+                    for item in files:
+                        self._api.dataset_download_file(
+                            dataset,
+                            item,
+                            path=str(destination),
+                            force=overwrite,
+                            quiet=True,
+                        )
+                else:
+                    self._api.dataset_download_files(
+                        dataset,
+                        path=str(destination),
+                        unzip=unzip,
+                        force=overwrite,
+                        quiet=True,
+                    )
+            else:
+                if files:
+                    for item in files:
+                        self._api.competition_download_file(
+                            competition,
+                            item,
+                            path=str(destination),
+                            force=overwrite,
+                            quiet=True,
+                        )
+                else:
+                    self._api.competition_download_files(
+                        competition,
+                        path=str(destination),
+                        force=overwrite,
+                        quiet=True,
+                    )
+                if unzip:
+                    self._unpack_competition_archives(destination)
+        except DatasetDownloadError:
+            raise
+        except Exception as exc:
+            raise DatasetDownloadError(f"Kaggle API failed: {exc}") from exc
+        return ["kaggle.api", identifier]
+
+    def _unpack_competition_archives(self, destination: Path) -> None:
+        # competition_download_files has no unzip flag, unlike datasets.
+        for archive in list(destination.glob("*.zip")):
+            shutil.unpack_archive(str(archive), str(destination))
+
+    def _download_via_cli(
+        self,
+        destination: Path,
+        *,
+        dataset: Optional[str],
+        competition: Optional[str],
+        files: Optional[Iterable[str]],
+        unzip: bool,
+        extra_args: Optional[Iterable[str]],
+    ) -> list[str]:
         command = self._build_command(
             dataset=dataset,
             competition=competition,
@@ -57,10 +190,7 @@ class KaggleDownloader:
         if result.returncode != 0:
             message = result.stderr.strip() or result.stdout.strip()
             raise DatasetDownloadError(f"Kaggle CLI failed: {message}")
-        if unzip:
-            self._cleanup_archives(destination, keep_archive)
-        details = self._build_details(destination, command)
-        return DownloadResult(dataset_path=destination, details=details)
+        return command
 
     def _build_command(
         self,
@@ -96,20 +226,25 @@ class KaggleDownloader:
         command.append(identifier or "")
         return command
 
-    def _cleanup_archives(self, destination: Path, keep_archive: bool) -> None:
+    def _cleanup_archives(self, destination: Path) -> None:
         for archive in destination.glob("*.zip"):
-            if keep_archive:
-                continue
             archive.unlink(missing_ok=True)
 
     def _build_details(
         self,
         destination: Path,
         command: list[str],
+        *,
+        return_file_list: bool = False,
     ) -> Dict[str, Any]:
-        files = [str(path) for path in destination.iterdir() if path.is_file()]
-        return {
-            "command": command,
-            "file_count": len(files),
-            "files": files,
-        }
+        # Scanning the destination after every download is redundant for
+        # most callers and costs a full directory walk on large datasets;
+        # the listing is produced only on request.
+        details: Dict[str, Any] = {"command": command}
+        if return_file_list:
+            files = [
+                str(path) for path in destination.iterdir() if path.is_file()
+            ]
+            details["file_count"] = len(files)
+            details["files"] = files
+        return details
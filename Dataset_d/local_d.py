@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import shutil
+from functools import partial
 from pathlib import Path
 from typing import Dict
 
@@ -9,6 +10,7 @@ from Dataset_d.common import (
     DatasetDownloadError,
     DownloadResult,
     ensure_destination,
+    fast_copy,
 )
 
 
@@ -22,6 +24,7 @@ class LocalDatasetImporter:
         source: Path,
         overwrite: bool = False,
         symlink: bool = False,
+        copy_mode: str = "auto",
     ) -> DownloadResult:
         source_path = Path(source).expanduser().resolve()
         if not source_path.exists():
@@ -31,24 +34,38 @@ class LocalDatasetImporter:
             self._symlink(source_path, destination)
         else:
             ensure_destination(destination, overwrite=overwrite)
-            self._copy(source_path, destination)
+            self._copy(source_path, destination, copy_mode=copy_mode)
         details: Dict[str, object] = {
             "source": str(source_path),
             "symlink": symlink,
         }
         return DownloadResult(dataset_path=destination, details=details)
 
-    def _copy(self, source: Path, destination: Path) -> None:
+    def _copy(
+        self,
+        source: Path,
+        destination: Path,
+        *,
+        copy_mode: str = "auto",
+    ) -> None:
         logger.info("Copying dataset from %s", source)
+        # fast_copy reflinks/hardlinks where the filesystem allows, making
+        # large local imports near-free instead of full byte copies.
+        copy_fn = partial(fast_copy, copy_mode=copy_mode)
         if source.is_dir():
             for item in source.iterdir():
                 dest = destination / item.name
                 if item.is_dir():
-                    shutil.copytree(item, dest, dirs_exist_ok=True)
+                    shutil.copytree(
+                        item,
+                        dest,
+                        dirs_exist_ok=True,
+                        copy_function=copy_fn,
+                    )
                 else:
-                    shutil.copy2(item, dest)
+                    copy_fn(item, dest)
         else:
-            shutil.copy2(source, destination / source.name)
+            copy_fn(source, destination / source.name)
 
     def _symlink(self, source: Path, destination: Path) -> None:
         logger.info("Linking dataset from %s", source)
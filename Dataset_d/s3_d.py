@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 import shutil
 import importlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -10,6 +12,9 @@ from Dataset_d.common import (
     DatasetDownloadError,
     DownloadResult,
     ensure_destination,
+    extract_stream,
+    is_archive_name,
+    iter_files,
 )
 
 
@@ -22,30 +27,98 @@ class S3Downloader:
         profile_name: Optional[str] = None,
         region_name: Optional[str] = None,
     ) -> None:
-        self._boto3 = self._load_boto3()
+        # boto3 import and client construction are deferred to the first
+        # download; instantiating the downloader stays cheap for callers
+        # that only enumerate sources.
         session_args: Dict[str, Any] = {}
         if profile_name:
             session_args["profile_name"] = profile_name
         if region_name:
             session_args["region_name"] = region_name
-        self._session = self._boto3.session.Session(**session_args)
-        self._client = self._session.client("s3")
+        self._session_args = session_args
+        self._client: Any = None
+        self._transfer_config: Any = None
+
+    def _ensure_client(self) -> Any:
+        if self._client is None:
+            boto3 = self._load_boto3()
+            session = boto3.session.Session(**self._session_args)
+            self._client = session.client("s3")
+            self._transfer_config = self._build_transfer_config()
+        return self._client
+
+    def _build_transfer_config(self) -> Any:
+        """Tune S3Transfer for large objects.
+
+        A lower multipart threshold plus wide concurrency lets boto3
+        fetch big objects as parallel ranged GETs instead of one
+        serial stream.
+        """
+        transfer = importlib.import_module("boto3.s3.transfer")
+        return transfer.TransferConfig(
+            multipart_threshold=32 * 1024 * 1024,
+            multipart_chunksize=64 * 1024 * 1024,
+            max_concurrency=min(32, (os.cpu_count() or 1) * 4),
+            use_threads=True,
+        )
 
     def download(
         self,
         destination: Path,
         *,
         bucket: str,
-        key: str,
+        key: Optional[str] = None,
+        prefix: Optional[str] = None,
         version_id: Optional[str] = None,
         filename: Optional[str] = None,
         extract: bool = False,
         overwrite: bool = False,
         keep_archive: bool = False,
     ) -> DownloadResult:
+        if bool(key) == bool(prefix):
+            raise DatasetDownloadError(
+                "Specify exactly one of 'key' or 'prefix' for S3 downloads."
+            )
+        self._ensure_client()
         ensure_destination(destination, overwrite=overwrite)
+        if prefix:
+            files = self._download_prefix(destination, bucket, prefix)
+            details = {
+                "bucket": bucket,
+                "prefix": prefix,
+                "files": files,
+            }
+            return DownloadResult(dataset_path=destination, details=details)
+        key = key or ""
         target_name = filename or Path(key).name or "s3_object"
         target_path = destination / target_name
+
+        if extract and not keep_archive and is_archive_name(target_name):
+            # Extract straight from the object body; the archive never
+            # lands on disk and is read exactly once.
+            logger.info(
+                "Stream-extracting s3://%s/%s into %s",
+                bucket,
+                key,
+                destination,
+            )
+            get_kwargs: Dict[str, Any] = {"Bucket": bucket, "Key": key}
+            if version_id:
+                get_kwargs["VersionId"] = version_id
+            try:
+                body = self._client.get_object(**get_kwargs)["Body"]
+                extract_stream(body, target_name, destination)
+            except Exception as exc:  # pragma: no cover
+                raise DatasetDownloadError(
+                    f"Failed to download s3://{bucket}/{key}: {exc}"
+                ) from exc
+            details = {
+                "bucket": bucket,
+                "key": key,
+                "files": list(iter_files(destination)),
+            }
+            return DownloadResult(dataset_path=destination, details=details)
+
         logger.info("Downloading s3://%s/%s to %s", bucket, key, target_path)
         extra_args = {"VersionId": version_id} if version_id else None
         try:
@@ -54,9 +127,15 @@ class S3Downloader:
                 key,
                 str(target_path),
                 ExtraArgs=extra_args,
+                Config=self._transfer_config,
             )
         except TypeError:  # ExtraArgs only when present
-            self._client.download_file(bucket, key, str(target_path))
+            self._client.download_file(
+                bucket,
+                key,
+                str(target_path),
+                Config=self._transfer_config,
+            )
         except Exception as exc:  # pragma: no cover
             raise DatasetDownloadError(
                 f"Failed to download s3://{bucket}/{key}: {exc}"
@@ -75,6 +154,74 @@ class S3Downloader:
         }
         return DownloadResult(dataset_path=destination, details=details)
 
+    def _download_prefix(
+        self,
+        destination: Path,
+        bucket: str,
+        prefix: str,
+    ) -> list[str]:
+        """Mirror every object under ``prefix`` into ``destination``.
+
+        Keys are listed via the paginator, directories are pre-created in
+        one pass, and the downloads fan out across a thread pool; each
+        worker additionally gets multipart concurrency from the shared
+        TransferConfig.
+        """
+        logger.info("Listing s3://%s/%s", bucket, prefix)
+        paginator = self._client.get_paginator("list_objects_v2")
+        jobs: list[tuple[str, Path]] = []
+        try:
+            for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+                for entry in page.get("Contents", []):
+                    obj_key = entry["Key"]
+                    if obj_key.endswith("/"):
+                        continue
+                    relative = obj_key[len(prefix):].lstrip("/")
+                    target = destination / (relative or Path(obj_key).name)
+                    jobs.append((obj_key, target))
+        except Exception as exc:  # pragma: no cover
+            raise DatasetDownloadError(
+                f"Failed to list s3://{bucket}/{prefix}: {exc}"
+            ) from exc
+        if not jobs:
+            raise DatasetDownloadError(
+                f"No objects found under s3://{bucket}/{prefix}."
+            )
+        for _, target in jobs:
+            target.parent.mkdir(parents=True, exist_ok=True)
+        logger.info(
+            "Downloading %d objects from s3://%s/%s",
+            len(jobs),
+            bucket,
+            prefix,
+        )
+
+        def _fetch(job: tuple[str, Path]) -> str:
+            obj_key, target = job
+            self._client.download_file(
+                bucket,
+                obj_key,
+                str(target),
+                Config=self._transfer_config,
+            )
+            return str(target)
+
+        workers = min(8, len(jobs))
+        if workers <= 1:
+            return [_fetch(job) for job in jobs]
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_fetch, job) for job in jobs]
+                for future in as_completed(futures):
+                    future.result()
+                return [future.result() for future in futures]
+        except DatasetDownloadError:
+            raise
+        except Exception as exc:  # pragma: no cover
+            raise DatasetDownloadError(
+                f"Failed to download s3://{bucket}/{prefix}: {exc}"
+            ) from exc
+
     def _extract_archive(
         self,
         archive_path: Path,
@@ -87,7 +234,7 @@ class S3Downloader:
             return [str(archive_path)]
         if not keep_archive:
             archive_path.unlink(missing_ok=True)
-        return [str(path) for path in destination.rglob("*") if path.is_file()]
+        return list(iter_files(destination))
 
     def _load_boto3(self) -> Any:
         try:
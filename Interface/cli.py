@@ -4,11 +4,17 @@ import json
 
 import typer
 
-from Transcription_parakeet.App.pipeline import (
-    DEFAULT_PARAKEET_MODEL,
-    DEFAULT_SORTFORMER_MODEL,
-    run_pipeline,
-)
+try:  # orjson serializes large result payloads several times faster
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Default model names are repeated here so `--help` renders without
+# importing the pipeline (and, transitively, the NeMo stack). They must
+# stay in sync with Src.transcription.Parakeet and
+# Src.diarization.Softformer.
+DEFAULT_PARAKEET_MODEL = "nvidia/parakeet-tdt-0.6b-v2"
+DEFAULT_SORTFORMER_MODEL = "nvidia/diar_sortformer_4spk-v1"
 
 app = typer.Typer()
 
@@ -50,6 +56,10 @@ def transcribe(
     ),
 ) -> None:
     """Run the transcription pipeline from the command line."""
+    # Imported here so startup and --help stay fast; the pipeline pulls
+    # in the full model stack.
+    from Transcription_parakeet.App.pipeline import run_pipeline
+
     try:
         results = run_pipeline(
             files,
@@ -65,7 +75,14 @@ def transcribe(
             raise typer.Exit(code=2)
         raise
 
-    typer.echo(json.dumps(results, ensure_ascii=False, indent=2))
+    if orjson is not None:
+        rendered = orjson.dumps(
+            results,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    else:
+        rendered = json.dumps(results, ensure_ascii=False, indent=2)
+    typer.echo(rendered)
 
 
 def main() -> None:
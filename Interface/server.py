@@ -1,18 +1,29 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
+import mmap
 import os
 import shutil
 import sys
 import tempfile
 import time
+import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal
 
 from fastapi import FastAPI, File, Form, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+try:  # orjson encodes large result payloads several times faster
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -23,7 +34,28 @@ from Transcription_parakeet.App.pipeline import (  # noqa: E402
 )
 from Transcription_parakeet.config.logger_config import logger  # noqa: E402
 
-app = FastAPI(title="Audio Transcription Pipeline", version="1.0.0")
+if orjson is not None:
+
+    class _ORJSONResponse(JSONResponse):
+        """Render responses with orjson, including numpy scalars."""
+
+        media_type = "application/json"
+
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(
+                content,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            )
+
+    _default_response_class: type[JSONResponse] = _ORJSONResponse
+else:
+    _default_response_class = JSONResponse
+
+app = FastAPI(
+    title="Audio Transcription Pipeline",
+    version="1.0.0",
+    default_response_class=_default_response_class,
+)
 
 # try:
 #     cors_env = os.getenv("CORS_ALLOWED_ORIGINS", "")
@@ -67,7 +99,19 @@ app.add_middleware(
 VALID_MODES: set[str] = {"transcription", "diarization", "combined"}
 
 
+# Shared config keeping per-request validation lean: unknown fields are
+# dropped instead of tracked, and assignment revalidation is off since
+# instances are built once and never mutated.
+_MODEL_CONFIG = {
+    "extra": "ignore",
+    "validate_assignment": False,
+    "arbitrary_types_allowed": True,
+}
+
+
 class ProcessRequest(BaseModel):
+    model_config = _MODEL_CONFIG
+
     file_paths: list[str]
     mode: Literal["transcription", "diarization", "combined"] = "combined"
     model: str | None = DEFAULT_PARAKEET_MODEL
@@ -77,6 +121,8 @@ class ProcessRequest(BaseModel):
 
 
 class ProcessResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
     success: bool
     files_processed: int
     input_files: list[str]
@@ -85,6 +131,111 @@ class ProcessResponse(BaseModel):
     mode: str
 
 
+def _parse_form_paths(file_paths: str) -> list[str]:
+    """Decode the ``file_paths`` form field into a path list."""
+    try:
+        parsed = json.loads(file_paths)
+    except json.JSONDecodeError:
+        return [file_paths]
+    if isinstance(parsed, list):
+        return [str(item) for item in parsed]
+    return [str(parsed)]
+
+
+_upload_root_path: Path | None = None
+
+
+def _upload_root() -> Path:
+    """Return the process-wide upload directory, on tmpfs when available.
+
+    One long-lived directory replaces a mkdtemp/rmtree pair per request;
+    uploads get uuid-prefixed names inside it and are removed file by
+    file. /dev/shm keeps upload bytes in RAM, so ffmpeg's subsequent
+    read is served from page cache instead of a second disk pass.
+    """
+    global _upload_root_path
+    if _upload_root_path is None:
+        base = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        root = Path(base or tempfile.gettempdir()) / "parakeet-uploads"
+        try:
+            root.mkdir(parents=True, exist_ok=True)
+        except OSError:  # pragma: no cover - tmpfs full or unwritable
+            root = Path(tempfile.gettempdir()) / "parakeet-uploads"
+            root.mkdir(parents=True, exist_ok=True)
+        _upload_root_path = root
+    return _upload_root_path
+
+
+def _pin_pages(temp_path: str) -> mmap.mmap | None:
+    """Map an upload read-only and ask the kernel to keep its pages hot.
+
+    The mapping is never read from Python; holding it open with
+    MADV_WILLNEED prefaults the pages so the pipeline's open of the
+    same file hits page cache. Returns None when mapping fails (empty
+    file, exotic fs) — purely an optimization, never an error.
+    """
+    try:
+        with open(temp_path, "rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mapped, "madvise"):
+            mapped.madvise(mmap.MADV_WILLNEED)
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        return mapped
+    except (OSError, ValueError):
+        return None
+
+
+def _save_upload(upload: UploadFile, temp_path: str) -> None:
+    """Copy one upload to ``temp_path``, in-kernel when possible.
+
+    Spooled uploads that rolled over to disk expose a real fd, so
+    ``os.sendfile`` moves the bytes without user-space buffer bounces;
+    in-memory spools fall back to ``shutil.copyfileobj`` with a 1 MiB
+    buffer. Runs in a worker thread via ``run_in_threadpool`` so the
+    event loop is not blocked for the duration of the write.
+    """
+    source = upload.file
+    with open(temp_path, "wb") as buffer:
+        # SpooledTemporaryFile.fileno() forces the spool to roll over to
+        # disk, so consult the rollover flag first: an un-rolled spool
+        # has no OS-level fd worth probing, and probing would turn every
+        # in-memory upload into a disk file.
+        src_fd = None
+        if getattr(source, "_rolled", True):
+            try:
+                src_fd = source.fileno()
+            except (AttributeError, OSError):
+                src_fd = None
+        if src_fd is None:
+            size = getattr(upload, "size", None)
+            if size is not None and size < 10 * 1024 * 1024:
+                # Small uploads still sit in the in-memory spool; one
+                # read/write pair beats the chunked copy loop, and with
+                # the tmpfs upload root the bytes never touch disk.
+                source.seek(0)
+                buffer.write(source.read())
+                return
+        if src_fd is not None and hasattr(os, "sendfile"):
+            try:
+                remaining = os.fstat(src_fd).st_size
+                offset = 0
+                while remaining > 0:
+                    sent = os.sendfile(
+                        buffer.fileno(), src_fd, offset, remaining
+                    )
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+                if remaining == 0:
+                    return
+            except OSError:  # pragma: no cover - fs without sendfile
+                buffer.seek(0)
+                buffer.truncate()
+        source.seek(0)
+        shutil.copyfileobj(source, buffer, length=1 << 20)
+
+
 def _normalize_mode(mode: str) -> str:
     if mode not in VALID_MODES:
         logger.warning("Invalid mode '%s', defaulting to 'combined'", mode)
@@ -92,29 +243,54 @@ def _normalize_mode(mode: str) -> str:
     return mode
 
 
-def _shape_pipeline_output(
-    mode: str,
-    entries: list[dict[str, Any]],
-) -> list[dict[str, Any]]:
-    if mode == "transcription":
-        return [
-            {
-                "file": item.get("file"),
-                "text": item.get("text"),
-                "score": item.get("score"),
-                "timestamps": item.get("timestamps"),
-            }
-            for item in entries
-        ]
-    if mode == "diarization":
+# Hoisted so shaping does not rebuild the key sets per entry.
+_TRANSCRIPTION_KEYS = ("file", "text", "score", "timestamps")
+_DIARIZATION_KEYS = ("file", "speakers")
+
+
+def _make_shaper(keys: tuple[str, ...], default_factories: dict[str, Any]):
+    """Build a shaping function specialized for one mode's key tuple.
+
+    The keys and defaults are bound in the closure, so per-call work is
+    just the passthrough check and one comprehension — no mode branch.
+    """
+
+    def _default(key: str) -> Any:
+        factory = default_factories.get(key)
+        return factory() if factory is not None else None
+
+    def _shape(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        # Entries that already carry exactly the target keys pass
+        # through untouched, making shaping a no-op instead of
+        # rebuilding thousands of dicts on large responses.
+        if all(tuple(item) == keys for item in entries):
+            return entries
         return [
             {
-                "file": item.get("file"),
-                "speakers": item.get("speakers", []),
+                key: item[key] if key in item else _default(key)
+                for key in keys
             }
             for item in entries
         ]
-    return entries
+
+    return _shape
+
+
+_SHAPERS = {
+    "transcription": _make_shaper(_TRANSCRIPTION_KEYS, {}),
+    "diarization": _make_shaper(_DIARIZATION_KEYS, {"speakers": list}),
+    "combined": lambda entries: entries,
+}
+
+
+def _shape_pipeline_output(
+    mode: str,
+    entries: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    shaper = _SHAPERS.get(mode)
+    if shaper is None:
+        return entries
+    return shaper(entries)
 
 
 def _process_inputs(
@@ -141,22 +317,200 @@ def _process_inputs(
     return effective_mode, shaped
 
 
-@app.post("/process_json", response_model=ProcessResponse)
-async def process_audio_json(request: ProcessRequest):
-    start_time = time.time()
+# Caps simultaneous run_pipeline calls so bursts queue in asyncio
+# instead of racing tensors onto the device and OOMing it. Defaults to
+# one in-flight batch per process (single-GPU assumption); raise
+# PARAKEET_GPU_SLOTS on multi-GPU hosts.
+_GPU_SLOTS = int(os.environ.get("PARAKEET_GPU_SLOTS", "1"))
+_inference_semaphore = asyncio.Semaphore(_GPU_SLOTS)
+# Requests currently holding or waiting for a slot; exposed via /health
+# so callers can detect saturation.
+_inference_pending = 0
 
-    if not request.file_paths:
-        raise HTTPException(status_code=400, detail="No files provided.")
+
+@contextlib.asynccontextmanager
+async def _inference_slot():
+    global _inference_pending
+    _inference_pending += 1
+    try:
+        async with _inference_semaphore:
+            yield
+    finally:
+        _inference_pending -= 1
+
+
+# Concurrent /process_json requests within this window are merged into
+# one run_pipeline call so the model sees one large batch instead of
+# many small ones; p95 latency pays at most about half the window.
+_COALESCE_WINDOW_S = 0.05
+_COALESCE_MAX_FILES = 32
+
+# (future, file_paths, pipeline-config key)
+_BatchItem = tuple[asyncio.Future, list[str], tuple]
+_batch_queue: asyncio.Queue[_BatchItem] | None = None
+
+
+@app.on_event("startup")
+async def _start_batcher() -> None:
+    global _batch_queue
+    _batch_queue = asyncio.Queue()
+    asyncio.create_task(_batcher(_batch_queue))
+
+
+@app.on_event("startup")
+async def _warm_models() -> None:
+    """Load both models before accepting traffic.
+
+    The load_model functions memoize per model name, so this moves the
+    multi-second first-request load cost to startup. Set
+    PRELOAD_MODELS=0 to skip (e.g. lightweight dev runs).
+    """
+    if os.environ.get("PRELOAD_MODELS", "1") != "1":
+        return
+
+    def _load() -> None:
+        from Transcription_parakeet.Src.diarization.Softformer import (
+            load_model as load_diarization_model,
+        )
+        from Transcription_parakeet.Src.transcription.Parakeet import (
+            load_model as load_transcription_model,
+        )
+
+        load_transcription_model()
+        load_diarization_model()
 
     try:
-        mode, result = _process_inputs(
-            input_paths=request.file_paths,
-            mode=request.mode,
+        await run_in_threadpool(_load)
+    except Exception:  # pragma: no cover - missing checkpoints offline
+        logger.exception("Model warmup failed; first request will retry")
+
+
+async def _batcher(queue: asyncio.Queue[_BatchItem]) -> None:
+    """Drain coalescable requests and issue grouped pipeline calls."""
+    loop = asyncio.get_running_loop()
+    while True:
+        pending = [await queue.get()]
+        total = len(pending[0][1])
+        deadline = loop.time() + _COALESCE_WINDOW_S
+        while total < _COALESCE_MAX_FILES:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            pending.append(item)
+            total += len(item[1])
+        # Only requests with identical pipeline configuration can share
+        # one model call.
+        groups: dict[tuple, list[_BatchItem]] = {}
+        for item in pending:
+            groups.setdefault(item[2], []).append(item)
+        for key, items in groups.items():
+            await _run_coalesced_group(key, items)
+
+
+async def _run_coalesced_group(key: tuple, items: list[_BatchItem]) -> None:
+    (
+        model,
+        diarize,
+        diarization_model,
+        diarization_batch_size,
+        batch_size,
+    ) = key
+
+    all_paths = [path for _, paths, _ in items for path in paths]
+
+    def _run(paths: list[str]) -> list[dict[str, Any]]:
+        # Requests that left batch_size at the default share one wide
+        # pass, capped like the upload endpoint; an explicit client
+        # batch_size is part of the group key and honored as-is.
+        if batch_size == 1:
+            effective_batch = min(
+                len(paths),
+                int(os.environ.get("PARAKEET_MAX_BATCH", "16")),
+            )
+        else:
+            effective_batch = batch_size
+        return run_pipeline(
+            paths,
+            model=model,
+            batch_size=effective_batch,
+            diarize=diarize,
+            diarization_model=diarization_model,
+            diarization_batch_size=diarization_batch_size,
+        )
+
+    try:
+        async with _inference_slot():
+            results = await run_in_threadpool(_run, all_paths)
+    except BaseException as exc:  # noqa: BLE001 - fan failure out
+        for future, _, _ in items:
+            if not future.done():
+                future.set_exception(exc)
+        return
+    if len(results) != len(all_paths) and len(items) > 1:
+        # Some inputs were dropped by validation, so positional
+        # splitting would misattribute entries; redo per request.
+        for future, paths, _ in items:
+            try:
+                async with _inference_slot():
+                    single = await run_in_threadpool(_run, paths)
+            except BaseException as exc:  # noqa: BLE001
+                if not future.done():
+                    future.set_exception(exc)
+                continue
+            if not future.done():
+                future.set_result(single)
+        return
+    offset = 0
+    for future, paths, _ in items:
+        chunk = results[offset:offset + len(paths)]
+        offset += len(paths)
+        if not future.done():
+            future.set_result(chunk)
+
+
+async def _process_inputs_coalesced(
+    request: ProcessRequest,
+) -> tuple[str, list[dict[str, Any]]]:
+    effective_mode = _normalize_mode(request.mode)
+    diarize = effective_mode != "transcription"
+    if _batch_queue is None:
+        # Startup hook has not run (e.g. direct invocation); process
+        # inline with the synchronous path.
+        return await run_in_threadpool(
+            _process_inputs,
+            request.file_paths,
+            request.mode,
             model=request.model,
             batch_size=request.batch_size,
             diarization_model=request.diarization_model,
             diarization_batch_size=request.diarization_batch_size,
         )
+    key = (
+        request.model or None,
+        diarize,
+        request.diarization_model if diarize else None,
+        request.diarization_batch_size,
+        request.batch_size or 1,
+    )
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    await _batch_queue.put((future, request.file_paths, key))
+    entries = await future
+    return effective_mode, _shape_pipeline_output(effective_mode, entries)
+
+
+@app.post("/process_json", response_model=ProcessResponse)
+async def process_audio_json(request: ProcessRequest):
+    start_time = time.time()
+
+    if not request.file_paths:
+        raise HTTPException(status_code=400, detail="No files provided.")
+
+    try:
+        mode, result = await _process_inputs_coalesced(request)
     except Exception as exc:  # pragma: no cover
         logger.error("Error processing JSON request: %s", exc)
         raise HTTPException(
@@ -166,16 +520,68 @@ async def process_audio_json(request: ProcessRequest):
 
     processing_time = time.time() - start_time
 
+    basename = os.path.basename  # hoisted out of the per-path loop
     return ProcessResponse(
         success=True,
         files_processed=len(request.file_paths),
-        input_files=[os.path.basename(p) for p in request.file_paths],
+        input_files=[basename(p) for p in request.file_paths],
         result=result,
         processing_time=processing_time,
         mode=mode,
     )
 
 
+@app.post("/process_json_stream")
+async def process_audio_json_stream(request: ProcessRequest):
+    """Stream per-file results as NDJSON lines.
+
+    Each input file is processed in turn and its entries are emitted as
+    soon as they exist, so clients see first results after one file's
+    inference instead of the whole batch, and the server never holds
+    more than one file's output in memory. run_pipeline has no
+    incremental API, hence the per-file calls; /process_json remains
+    the buffered, batched variant.
+    """
+    if not request.file_paths:
+        raise HTTPException(status_code=400, detail="No files provided.")
+    effective_mode = _normalize_mode(request.mode)
+    diarize = effective_mode != "transcription"
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        def dumps(obj: Any) -> bytes:
+            return json.dumps(obj, ensure_ascii=False).encode()
+
+    async def _generate():
+        for path in request.file_paths:
+            try:
+                async with _inference_slot():
+                    entries = await run_in_threadpool(
+                        run_pipeline,
+                        [path],
+                        model=request.model or None,
+                        batch_size=1,
+                        diarize=diarize,
+                        diarization_model=(
+                            request.diarization_model if diarize else None
+                        ),
+                        diarization_batch_size=request.diarization_batch_size,
+                    )
+            except Exception as exc:  # pragma: no cover
+                logger.error("Error processing %s: %s", path, exc)
+                yield dumps({"file": path, "error": "processing failed"})
+                yield b"\n"
+                continue
+            for entry in _shape_pipeline_output(effective_mode, entries):
+                yield dumps(entry)
+                yield b"\n"
+
+    return StreamingResponse(
+        _generate(),
+        media_type="application/x-ndjson",
+    )
+
+
 @app.get("/api")
 async def root():
     return {
@@ -187,7 +593,12 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {
+        "status": "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "gpu_slots": _GPU_SLOTS,
+        "inference_pending": _inference_pending,
+    }
 
 
 @app.post("/process", response_model=ProcessResponse)
@@ -201,32 +612,45 @@ async def process_audio(
     diarization_batch_size: int | None = Form(None),
 ):
     start_time = time.time()
+    pinned_maps: list[mmap.mmap] = []
     temp_files: list[str] = []
-    temp_dir: str | None = None
+    display_names: list[str] | None = None
 
     effective_mode = mode.strip() if mode else "combined"
 
     input_paths: list[str] = []
 
     if files:
-        temp_dir = tempfile.mkdtemp()
+
+        async def _land(upload: UploadFile, temp_path: str) -> None:
+            await upload.seek(0)
+            await run_in_threadpool(_save_upload, upload, temp_path)
+            mapped = _pin_pages(temp_path)
+            if mapped is not None:
+                pinned_maps.append(mapped)
+
+        display_names = []
+        pending: list[Any] = []
         for file in files:
             if not file.filename:
                 continue
-            temp_path = os.path.join(temp_dir, file.filename)
-            with open(temp_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            # uuid-prefixed names in the shared upload root make per
+            # request directories (and their mkdtemp/rmtree syscalls)
+            # unnecessary.
+            safe_name = os.path.basename(file.filename)
+            temp_path = str(
+                _upload_root() / f"{uuid.uuid4().hex}_{safe_name}"
+            )
             input_paths.append(temp_path)
             temp_files.append(temp_path)
-    elif file_paths:
-        try:
-            path_list = json.loads(file_paths)
-            if isinstance(path_list, list):
-                input_paths.extend(path_list)
-            else:
-                input_paths.append(str(path_list))
-        except json.JSONDecodeError:
-            input_paths.append(file_paths)
+            display_names.append(safe_name)
+            pending.append(_land(file, temp_path))
+        # Saves overlap in the thread pool, so N uploads land in about
+        # max(Ti) instead of sum(Ti).
+        if pending:
+            await asyncio.gather(*pending)
+    if not input_paths and file_paths:
+        input_paths = _parse_form_paths(file_paths)
 
     if not input_paths:
         raise HTTPException(status_code=400, detail="No files provided.")
@@ -234,15 +658,31 @@ async def process_audio(
     cleaned_model = model.strip() if model else None
     cleaned_diar_model = diarization_model.strip() if diarization_model else None
 
-    try:
-        mode_value, result = _process_inputs(
-            input_paths=input_paths,
-            mode=effective_mode,
-            model=cleaned_model,
-            batch_size=batch_size,
-            diarization_model=cleaned_diar_model,
-            diarization_batch_size=diarization_batch_size,
+    # When the caller left the form default, batch all files of the
+    # request into one forward pass so the encoder is amortized across
+    # them; the pipeline already orders inputs by size to limit padding
+    # waste. An explicit batch_size is respected as-is.
+    if batch_size == 1 and len(input_paths) > 1:
+        effective_batch = min(
+            len(input_paths),
+            int(os.environ.get("PARAKEET_MAX_BATCH", "16")),
         )
+    else:
+        effective_batch = batch_size
+
+    try:
+        # Inference runs on the thread pool so the event loop keeps
+        # serving /health and other requests for its duration.
+        async with _inference_slot():
+            mode_value, result = await run_in_threadpool(
+                _process_inputs,
+                input_paths,
+                effective_mode,
+                model=cleaned_model,
+                batch_size=effective_batch,
+                diarization_model=cleaned_diar_model,
+                diarization_batch_size=diarization_batch_size,
+            )
     except Exception as exc:  # pragma: no cover
         logger.error("Error processing audio: %s", exc)
         raise HTTPException(
@@ -250,21 +690,33 @@ async def process_audio(
             detail="Internal server error",
         ) from exc
     finally:
+        # Cleanup only applies to the uploads branch; file_paths
+        # requests never create temp state to sweep. Removing the
+        # tracked files directly avoids an rmtree traversal.
+        for mapped in pinned_maps:
+            try:
+                mapped.close()
+            except (OSError, ValueError):  # pragma: no cover
+                pass
         for temp_file in temp_files:
             try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
+                os.remove(temp_file)
+            except FileNotFoundError:
+                pass
             except OSError:  # pragma: no cover
                 logger.warning("Failed to cleanup temp file %s", temp_file)
-        if temp_dir and os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir, ignore_errors=True)
 
     processing_time = time.time() - start_time
 
+    basename = os.path.basename  # hoisted out of the per-path loop
     return ProcessResponse(
         success=True,
         files_processed=len(input_paths),
-        input_files=[os.path.basename(p) for p in input_paths],
+        input_files=(
+            display_names
+            if display_names is not None
+            else [basename(p) for p in input_paths]
+        ),
         result=result,
         processing_time=processing_time,
         mode=mode_value,
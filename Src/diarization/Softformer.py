@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import functools
+import re
+import threading
 from collections.abc import Sequence
 from typing import Any
 
+import numpy as np
 from nemo.collections.asr.models import SortformerEncLabelModel
 
 from Transcription_parakeet.Src.model.model_cache import find_local_checkpoint
@@ -13,9 +17,13 @@ from Transcription_parakeet.config.logger_config import logger
 DEFAULT_SORTFORMER_MODEL = "nvidia/diar_sortformer_4spk-v1"
 
 
-def load_model(
-    model_name: str = DEFAULT_SORTFORMER_MODEL,
-) -> SortformerEncLabelModel:
+# Serializes model loads so concurrent first requests share one
+# restore instead of racing duplicate multi-GB initializations.
+_MODEL_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_model_cached(model_name: str) -> SortformerEncLabelModel:
     logger.info("Looking for a local diarization model for %s", model_name)
     local = find_local_checkpoint(model_name)
     if local is not None:
@@ -49,6 +57,23 @@ def load_model(
     return model
 
 
+def load_model(
+    model_name: str = DEFAULT_SORTFORMER_MODEL,
+) -> SortformerEncLabelModel:
+    """Load the Sortformer model, memoized per model name.
+
+    Repeated calls (one per request in server mode) reuse the
+    already-initialized instance instead of re-reading the checkpoint.
+    """
+    with _MODEL_LOCK:
+        return _load_model_cached(model_name)
+
+
+def clear_model_cache() -> None:
+    """Drop memoized model instances (intended for tests)."""
+    _load_model_cached.cache_clear()
+
+
 def diarize_files(
     model: SortformerEncLabelModel,
     files: Sequence[str],
@@ -75,25 +100,92 @@ def diarize_files(
     return list(output), None
 
 
+def diarize_files_cached(
+    model: SortformerEncLabelModel,
+    cache: Any,
+    *,
+    batch_size: int = 1,
+    include_tensor_outputs: bool = False,
+    postprocessing_yaml: str | None = None,
+    num_workers: int = 0,
+    paths: Sequence[str] | None = None,
+) -> tuple[list[list[Any]], list[Any] | None]:
+    """Diarize from a ``DecodedAudioCache`` instead of re-reading WAVs.
+
+    Pass ``paths`` to pin the signal order to a specific file list; the
+    cache's insertion order need not match it.
+    """
+    signals = cache.signals(paths)
+    logger.info(
+        "Running Sortformer diarization on %d pre-decoded file(s)",
+        len(signals),
+    )
+    diarize_kwargs: dict[str, Any] = {
+        "audio": signals,
+        "batch_size": batch_size,
+        "include_tensor_outputs": include_tensor_outputs,
+        "postprocessing_yaml": postprocessing_yaml,
+        "num_workers": num_workers,
+        "verbose": False,
+    }
+
+    output = model.diarize(**diarize_kwargs)
+    if include_tensor_outputs:
+        segments, tensors = output
+        return list(segments), list(tensors)
+    return list(output), None
+
+
+# Matches one "start end speaker_N" (or bare numeric speaker) RTTM-style
+# line; used to parse a whole batch of segments in a single scan. Extra
+# fields after the speaker are ignored, matching the old split-based
+# parser which only consumed the first three tokens. The trailing
+# separator is [ \t] rather than \s so a match can never swallow the
+# following line in the MULTILINE bulk scan.
+_SEGMENT_LINE_RE = re.compile(
+    r"^[ \t]*(\S+)[ \t]+(\S+)[ \t]+"
+    r"(?:speaker_)?(\d+(?:\.\d+)?)(?:[ \t].*)?$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def _parse_segments_bulk(
+    segments: Sequence[Any],
+) -> list[tuple[float, float, int]] | None:
+    """Parse a homogeneous batch of segment strings in one pass.
+
+    Long recordings produce thousands of "start end speaker" entries;
+    matching them with a single multiline regex and converting via numpy
+    replaces per-entry split/float calls with two C-level scans. Returns
+    None when any entry does not fit the expected shape so the caller
+    falls back to the per-entry parser.
+    """
+    if not segments or not all(isinstance(e, str) for e in segments):
+        return None
+    matches = _SEGMENT_LINE_RE.findall("\n".join(segments))
+    if len(matches) != len(segments):
+        return None
+    try:
+        columns = np.asarray(matches)
+        starts = columns[:, 0].astype(np.float64)
+        ends = columns[:, 1].astype(np.float64)
+        speakers = columns[:, 2].astype(np.float64).astype(np.int64)
+    except ValueError:
+        return None
+    return list(zip(starts.tolist(), ends.tolist(), speakers.tolist()))
+
+
 def _parse_segment(entry: Any) -> tuple[float, float, int] | None:
     if isinstance(entry, str):
-        parts = entry.strip().split()
-        if len(parts) < 3:
+        # One C-level match replaces the strip/split/startswith chain
+        # the old parser ran per entry.
+        match = _SEGMENT_LINE_RE.match(entry)
+        if match is None:
             return None
         try:
-            start = float(parts[0])
-            end = float(parts[1])
+            return float(match[1]), float(match[2]), int(float(match[3]))
         except ValueError:
             return None
-        speaker_token = parts[2]
-        try:
-            if speaker_token.lower().startswith("speaker_"):
-                speaker_idx = int(speaker_token.split("_", 1)[1])
-            else:
-                speaker_idx = int(float(speaker_token))
-        except ValueError:
-            return None
-        return start, end, speaker_idx
 
     if isinstance(entry, Sequence) and len(entry) >= 3:
         try:
@@ -110,26 +202,29 @@ def _segments_to_dict(
     file_path: str,
     segments: Sequence[Any],
 ) -> dict[str, Any]:
-    structured: list[dict[str, Any]] = []
-    for entry in segments:
-        parsed = _parse_segment(entry)
-        if parsed is None:
-            logger.debug(
-                "Unexpected diarization entry for %s: %s",
-                file_path,
-                entry,
-            )
-            continue
-        start, end, speaker_idx = parsed
-        structured.append(
-            {
-                "start": start,
-                "end": end,
-                "duration": max(0.0, end - start),
-                "speaker_index": speaker_idx,
-                "speaker_label": f"SPEAKER_{speaker_idx:02d}",
-            }
-        )
+    parsed_batch = _parse_segments_bulk(segments)
+    if parsed_batch is None:
+        parsed_batch = []
+        for entry in segments:
+            parsed = _parse_segment(entry)
+            if parsed is None:
+                logger.debug(
+                    "Unexpected diarization entry for %s: %s",
+                    file_path,
+                    entry,
+                )
+                continue
+            parsed_batch.append(parsed)
+    structured = [
+        {
+            "start": start,
+            "end": end,
+            "duration": max(0.0, end - start),
+            "speaker_index": speaker_idx,
+            "speaker_label": f"SPEAKER_{speaker_idx:02d}",
+        }
+        for start, end, speaker_idx in parsed_batch
+    ]
     return {"file": file_path, "segments": structured}
 
 
@@ -173,7 +268,9 @@ __all__ = [
     "DEFAULT_SORTFORMER_MODEL",
     "validate_paths",
     "load_model",
+    "clear_model_cache",
     "diarize_files",
+    "diarize_files_cached",
     "convert_results",
     "print_results",
 ]
@@ -4,33 +4,56 @@ from __future__ import annotations
 
 import sys
 from importlib import import_module
-from typing import Any
-
-_softformer = import_module(f"{__name__}.Softformer")
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - import-time guard for type checkers
+    from .Softformer import (
+        DEFAULT_SORTFORMER_MODEL,
+        clear_model_cache,
+        convert_results,
+        diarize_files,
+        diarize_files_cached,
+        load_model,
+        print_results,
+        validate_paths,
+    )
 
 __all__ = [
     "DEFAULT_SORTFORMER_MODEL",
     "load_model",
+    "clear_model_cache",
     "diarize_files",
+    "diarize_files_cached",
     "convert_results",
     "print_results",
     "validate_paths",
+    "Softformer",
 ]
 
-DEFAULT_SORTFORMER_MODEL = _softformer.DEFAULT_SORTFORMER_MODEL
-load_model = _softformer.load_model
-diarize_files = _softformer.diarize_files
-convert_results = _softformer.convert_results
-print_results = _softformer.print_results
-validate_paths = _softformer.validate_paths
+_softformer: ModuleType | None = None
+
 
-# Allow both `Softformer` and `softformer` module paths for compatibility.
-sys.modules[f"{__name__}.Softformer"] = _softformer
-sys.modules[f"{__name__}.softformer"] = _softformer
+def _load() -> ModuleType:
+    """Import Softformer (and, transitively, NeMo) on first access only."""
+    global _softformer
+    if _softformer is None:
+        _softformer = import_module(f"{__name__}.Softformer")
+        # Allow both `Softformer` and `softformer` module paths for
+        # compatibility.
+        sys.modules[f"{__name__}.softformer"] = _softformer
+    return _softformer
 
 
 def __getattr__(name: str) -> Any:
-    return getattr(_softformer, name)
+    module = _load()
+    if name == "Softformer":
+        return module
+    try:
+        return getattr(module, name)
+    except AttributeError as exc:  # pragma: no cover - bubble up original
+        message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(message) from exc
 
 
 def __dir__() -> list[str]:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import os
 from pathlib import Path
 from typing import Sequence
 
@@ -22,21 +24,60 @@ def candidate_dirs(extra_dirs: Sequence[Path] | None = None) -> list[Path]:
     return base
 
 
+@functools.lru_cache(maxsize=None)
+def _scan_nemo_dir(directory: Path) -> tuple[tuple[str, str], ...]:
+    """List the ``.nemo`` files in ``directory`` with one scandir pass.
+
+    Cached per directory so lookups for different model names share the
+    same scan instead of re-reading the directory each.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return tuple(
+                (entry.name, entry.path)
+                for entry in entries
+                if entry.name.endswith(".nemo")
+                and entry.is_file(follow_symlinks=False)
+            )
+    except OSError:
+        return ()
+
+
+@functools.lru_cache(maxsize=8)
+def _find_checkpoint_cached(
+    model_name: str,
+    search_dirs: tuple[Path, ...] | None,
+) -> Path | None:
+    safe_name = safe_model_filename(model_name)
+    for directory in candidate_dirs(search_dirs):
+        checkpoints = _scan_nemo_dir(directory)
+        for name, path in checkpoints:
+            if name == safe_name:
+                return Path(path)
+        if checkpoints:
+            return Path(checkpoints[0][1])
+    return None
+
+
 def find_local_checkpoint(
     model_name: str,
     *,
     search_dirs: Sequence[Path] | None = None,
 ) -> Path | None:
-    safe_name = safe_model_filename(model_name)
-    dirs = candidate_dirs(search_dirs)
-    for directory in dirs:
-        candidate = directory / safe_name
-        if candidate.exists():
-            return candidate
-        if directory.exists():
-            for path in directory.glob("*.nemo"):
-                return path
-    return None
+    """Locate a local ``.nemo`` checkpoint for ``model_name``.
+
+    Results are memoized per (model, search dirs); call
+    ``clear_checkpoint_cache`` after writing a new checkpoint so the
+    next lookup sees it.
+    """
+    dirs = tuple(search_dirs) if search_dirs else None
+    return _find_checkpoint_cached(model_name, dirs)
+
+
+def clear_checkpoint_cache() -> None:
+    """Forget memoized checkpoint lookups and directory scans."""
+    _find_checkpoint_cached.cache_clear()
+    _scan_nemo_dir.cache_clear()
 
 
 def default_output_dir() -> Path:
@@ -47,6 +88,7 @@ def default_output_dir() -> Path:
 
 __all__ = [
     "candidate_dirs",
+    "clear_checkpoint_cache",
     "default_output_dir",
     "find_local_checkpoint",
     "repo_root",
@@ -7,6 +7,8 @@ This script loads the model via ``ASRModel.from_pretrained`` and calls
 
 from __future__ import annotations
 
+import importlib
+import os
 from pathlib import Path
 import typer
 
@@ -17,6 +19,23 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def _enable_accelerated_downloads() -> None:
+    """Turn on huggingface_hub's multi-connection downloader when installed.
+
+    ``from_pretrained`` fetches multi-GB checkpoints over a single HTTPS
+    stream by default; the optional ``hf_transfer`` backend splits the
+    transfer across connections and can saturate fast links. Respects an
+    explicit HF_HUB_ENABLE_HF_TRANSFER setting from the environment.
+    """
+    if "HF_HUB_ENABLE_HF_TRANSFER" in os.environ:
+        return
+    try:
+        importlib.import_module("hf_transfer")
+    except ImportError:
+        return
+    os.environ["HF_HUB_ENABLE_HF_TRANSFER"] = "1"
+
+
 def download_and_save(model_name: str, out_dir: Path, force: bool = False) -> Path:
     """Download the pretrained model and save it as a .nemo file.
 
@@ -38,6 +57,7 @@ def download_and_save(model_name: str, out_dir: Path, force: bool = False) -> Pa
     print(
         "Loading pretrained model '{}' (this downloads if needed)...".format(model_name)
     )
+    _enable_accelerated_downloads()
     model = ASRModel.from_pretrained(model_name)
 
     print("Saving model to {} ...".format(out_path))
@@ -2,15 +2,32 @@ from __future__ import annotations
 
 import importlib
 import contextlib
+import functools
 import json
 import os
 import shutil
 import subprocess
 import tempfile
+import threading
+import wave
 from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Tuple
 
+import numpy as np
+
+try:  # Optional in-process decoder; the ffmpeg CLI remains the fallback.
+    import av
+except ImportError:  # pragma: no cover - exercised without PyAV installed
+    av = None
+
+try:  # Faster JSON decode of ffprobe output; stdlib json otherwise.
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from Transcription_parakeet.config.logger_config import logger
 
 
@@ -19,9 +36,18 @@ TARGET_CHANNELS = 1
 TARGET_SAMPLE_WIDTH = 2  # bytes -> 16-bit linear PCM
 TARGET_EXTENSION = ".wav"
 
+# Files above this size are mapped with np.memmap instead of read into RAM.
+DECODE_MEMMAP_THRESHOLD_BYTES = 64 << 20
+
 
+@functools.lru_cache(maxsize=1)
 def _resolve_executables() -> Tuple[str, str]:
-    """Return paths for (ffmpeg, ffprobe)."""
+    """Return paths for (ffmpeg, ffprobe), resolved once per process.
+
+    The static_ffmpeg helpers touch the filesystem (and may download on
+    first use), so memoizing keeps that cost off the per-file probe and
+    convert paths.
+    """
     try:
         static_ffmpeg = importlib.import_module("static_ffmpeg")
     except ImportError:
@@ -38,6 +64,57 @@ def _resolve_executables() -> Tuple[str, str]:
         return "ffmpeg", "ffprobe"
 
 
+# Constant command segments, built once instead of per invocation.
+_PROBE_ARGS: tuple[str, ...] = (
+    "-v",
+    "error",
+    "-show_entries",
+    "stream=index,codec_type,channels,sample_rate,sample_fmt",
+    "-of",
+    "json",
+)
+_FFMPEG_BASE_ARGS: tuple[str, ...] = (
+    "-y",
+    "-hide_banner",
+    "-loglevel",
+    "error",
+    # One decode thread per process; batch-level parallelism comes from
+    # running several ffmpeg instances side by side.
+    "-threads",
+    "1",
+    "-i",
+)
+_FFMPEG_ENCODE_ARGS: tuple[str, ...] = (
+    "-ar",
+    str(TARGET_SAMPLE_RATE),
+    "-ac",
+    str(TARGET_CHANNELS),
+    "-acodec",
+    "pcm_s16le",
+)
+
+
+def _probe_command(ffprobe: str, path: str) -> list[str]:
+    return [str(ffprobe), *_PROBE_ARGS, str(path)]
+
+
+def _parse_probe_output(stdout: bytes) -> dict[str, Any] | None:
+    """Extract sample_rate/channels/sample_fmt from ffprobe JSON output."""
+    # Both parsers take the raw bytes directly, skipping a decode copy.
+    data = orjson.loads(stdout) if orjson is not None else json.loads(stdout)
+    for stream in data.get("streams", []):
+        if stream.get("codec_type") == "audio":
+            sr = stream.get("sample_rate")
+            ch = stream.get("channels")
+            fmt = stream.get("sample_fmt")
+            return {
+                "sample_rate": int(sr) if sr else 0,
+                "channels": int(ch) if ch else 0,
+                "sample_fmt": fmt,
+            }
+    return None
+
+
 def _ffprobe_inspect(path: str) -> dict[str, Any] | None:
     """Return sample_rate/channels/sample_fmt for the first audio stream.
 
@@ -45,38 +122,58 @@ def _ffprobe_inspect(path: str) -> dict[str, Any] | None:
     """
     _, ffprobe = _resolve_executables()
 
-    cmd = [
-        str(ffprobe),
-        "-v",
-        "error",
-        "-show_entries",
-        "stream=index,codec_type,channels,sample_rate,sample_fmt",
-        "-of",
-        "json",
-        str(path),
-    ]
-
     try:
-        proc = subprocess.run(cmd, check=True, capture_output=True)
-        out = proc.stdout.decode("utf-8")
-        data = json.loads(out)
-        streams = data.get("streams", [])
-        for stream in streams:
-            if stream.get("codec_type") == "audio":
-                sr = stream.get("sample_rate")
-                ch = stream.get("channels")
-                fmt = stream.get("sample_fmt")
-                return {
-                    "sample_rate": int(sr) if sr else 0,
-                    "channels": int(ch) if ch else 0,
-                    "sample_fmt": fmt,
-                }
-        return None
+        proc = subprocess.run(
+            _probe_command(ffprobe, path), check=True, capture_output=True
+        )
+        return _parse_probe_output(proc.stdout)
     except subprocess.CalledProcessError as exc:
         logger.debug("ffprobe failed for %s: %s", path, exc)
         return None
 
 
+# How many ffprobe processes to keep in flight at once when batch-probing.
+_PROBE_BATCH_SIZE = 16
+
+
+def _ffprobe_inspect_many(
+    paths: Sequence[str],
+) -> dict[str, dict[str, Any] | None]:
+    """Probe several files with overlapping ffprobe invocations.
+
+    ffprobe only accepts a single input, so one process per file is
+    unavoidable — but launching a wave of them with ``Popen`` before
+    collecting any output overlaps the fork/exec and probe latency
+    instead of paying it serially per file.
+    """
+    _, ffprobe = _resolve_executables()
+    info: dict[str, dict[str, Any] | None] = {}
+
+    for start in range(0, len(paths), _PROBE_BATCH_SIZE):
+        batch = paths[start : start + _PROBE_BATCH_SIZE]
+        procs: dict[str, subprocess.Popen] = {}
+        for path in batch:
+            try:
+                procs[path] = subprocess.Popen(
+                    _probe_command(ffprobe, path),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
+            except OSError as exc:
+                logger.debug("Could not launch ffprobe for %s: %s", path, exc)
+                info[path] = None
+        for path, proc in procs.items():
+            stdout, _ = proc.communicate()
+            if proc.returncode != 0:
+                logger.debug(
+                    "ffprobe failed for %s (rc=%d)", path, proc.returncode
+                )
+                info[path] = None
+            else:
+                info[path] = _parse_probe_output(stdout)
+    return info
+
+
 def _needs_conversion(path: str, info: dict[str, Any] | None) -> bool:
     """Decide if conversion is required based on probe info."""
     if info is None:
@@ -96,6 +193,22 @@ def _needs_conversion(path: str, info: dict[str, Any] | None) -> bool:
     return False
 
 
+def _conversion_temp_root() -> str | None:
+    """Pick where conversion temp dirs live, preferring RAM-backed tmpfs.
+
+    Converted WAVs are write-once/read-once/delete, so staging them on
+    /dev/shm keeps the round trip off the storage stack entirely.
+    ``PARAKEET_TMPDIR`` overrides; None falls through to tempfile's
+    default (which itself honours TMPDIR).
+    """
+    override = os.environ.get("PARAKEET_TMPDIR")
+    if override:
+        return override
+    if os.path.isdir("/dev/shm"):
+        return "/dev/shm"
+    return None
+
+
 def _make_output_path(temp_dir: Path, original: Path, index: int) -> Path:
     base_name = original.stem or f"audio_{index:03d}"
     candidate = temp_dir / f"{base_name}_parakeet.wav"
@@ -104,43 +217,123 @@ def _make_output_path(temp_dir: Path, original: Path, index: int) -> Path:
     return candidate
 
 
-def _ffmpeg_convert(input_path: str, output_path: Path) -> None:
-    """Convert file to target WAV using ffmpeg CLI and raise on failure."""
+def _ffmpeg_convert(
+    input_path: str,
+    output_path: Path,
+    *,
+    capture_pcm: bool = False,
+) -> bytes | None:
+    """Convert file to target WAV using ffmpeg CLI and raise on failure.
+
+    With ``capture_pcm`` the single decode also emits raw s16le PCM on
+    stdout (ffmpeg's single-input/multiple-output form), so callers get
+    the samples in memory without re-reading the written WAV.
+    """
     ffmpeg, _ = _resolve_executables()
 
     cmd = [
         str(ffmpeg),
-        "-y",
-        "-hide_banner",
-        "-loglevel",
-        "error",
-        "-i",
+        *_FFMPEG_BASE_ARGS,
         str(input_path),
-        "-ar",
-        str(TARGET_SAMPLE_RATE),
-        "-ac",
-        str(TARGET_CHANNELS),
-        "-acodec",
-        "pcm_s16le",
+        *_FFMPEG_ENCODE_ARGS,
         "-f",
         "wav",
         str(output_path),
     ]
+    if capture_pcm:
+        cmd += [*_FFMPEG_ENCODE_ARGS, "-f", "s16le", "pipe:1"]
 
-    subprocess.run(
+    proc = subprocess.run(
         cmd,
         check=True,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
     )
+    return proc.stdout if capture_pcm else None
+
+
+def _pyav_convert(input_path: str, output_path: Path) -> bool:
+    """Convert to the target WAV in-process via PyAV, if available.
+
+    Skipping the subprocess saves the per-file fork/exec and dynamic
+    linker cost, which dominates for short clips. Returns False when
+    PyAV is missing or decoding fails so the caller can fall back to the
+    ffmpeg CLI.
+    """
+    if av is None:
+        return False
+    try:
+        with av.open(str(input_path)) as in_container:
+            in_stream = in_container.streams.audio[0]
+            resampler = av.AudioResampler(
+                format="s16",
+                layout="mono",
+                rate=TARGET_SAMPLE_RATE,
+            )
+            with av.open(str(output_path), "w", format="wav") as out:
+                out_stream = out.add_stream(
+                    "pcm_s16le", rate=TARGET_SAMPLE_RATE
+                )
+                for frame in in_container.decode(in_stream):
+                    for resampled in resampler.resample(frame):
+                        out.mux(out_stream.encode(resampled))
+                for resampled in resampler.resample(None):
+                    out.mux(out_stream.encode(resampled))
+                out.mux(out_stream.encode(None))
+        return True
+    except Exception as exc:  # PyAV error classes vary across versions
+        logger.debug("PyAV conversion failed for %s: %s", input_path, exc)
+        with contextlib.suppress(OSError):
+            os.unlink(output_path)
+        return False
+
+
+# Long-lived pool of conversion workers, shared by every
+# prepare_audio_files call so repeat batches (one per server request)
+# reuse warm threads instead of spawning a pool per call.
+_CONVERT_POOL: ThreadPoolExecutor | None = None
+_CONVERT_POOL_LOCK = threading.Lock()
+
+
+def _conversion_pool() -> ThreadPoolExecutor:
+    global _CONVERT_POOL
+    if _CONVERT_POOL is None:
+        with _CONVERT_POOL_LOCK:
+            if _CONVERT_POOL is None:
+                _CONVERT_POOL = ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    thread_name_prefix="parakeet-convert",
+                )
+    return _CONVERT_POOL
+
+
+def _convert_file(
+    input_path: str,
+    output_path: Path,
+    *,
+    capture_pcm: bool = False,
+) -> bytes | None:
+    """Convert one file, preferring the in-process PyAV path.
+
+    PCM capture always uses the ffmpeg CLI, which produces the WAV and
+    the in-memory samples from one decode pass.
+    """
+    if not capture_pcm and _pyav_convert(input_path, output_path):
+        return None
+    return _ffmpeg_convert(input_path, output_path, capture_pcm=capture_pcm)
 
 
 @contextlib.contextmanager
-def prepare_audio_files(paths: Sequence[str]) -> Iterator[list[str]]:
+def prepare_audio_files(
+    paths: Sequence[str],
+    *,
+    capture: DecodedAudioCache | None = None,
+) -> Iterator[list[str]]:
     """Yield a list of audio paths encoded for NeMo models.
 
     Converted files are written to a temporary directory cleaned up when the
-    context exits.
+    context exits. When ``capture`` is given, each conversion also pipes
+    its PCM into the cache so downstream decoding skips a disk read.
     """
 
     if not paths:
@@ -151,36 +344,77 @@ def prepare_audio_files(paths: Sequence[str]) -> Iterator[list[str]]:
     processed: list[str] = []
 
     try:
-        for idx, original_path in enumerate(paths):
+        existing: list[str] = []
+        for original_path in paths:
             if not os.path.exists(original_path):
                 logger.warning(
                     "Skipping missing audio file during preparation: %s",
                     original_path,
                 )
                 continue
+            existing.append(original_path)
+
+        # Only WAV inputs can possibly skip conversion, so non-WAV files
+        # are never probed; the WAV probes run as one overlapped batch.
+        probe_targets = [
+            p for p in existing
+            if Path(p).suffix.lower() == TARGET_EXTENSION
+        ]
+        info_by_path = (
+            _ffprobe_inspect_many(probe_targets) if probe_targets else {}
+        )
 
-            info = _ffprobe_inspect(original_path)
-            if not _needs_conversion(original_path, info):
+        jobs: list[tuple[str, Path]] = []
+        for idx, original_path in enumerate(existing):
+            # Unprobed files (non-WAV, or probe failure) always convert;
+            # only a successful probe can prove the file is reusable.
+            info = info_by_path.get(original_path)
+            if info is not None and not _needs_conversion(
+                original_path, info
+            ):
                 processed.append(original_path)
                 continue
 
             if temp_dir is None:
-                temp_dir = Path(tempfile.mkdtemp(prefix="parakeet_audio_"))
+                temp_dir = Path(
+                    tempfile.mkdtemp(
+                        prefix="parakeet_audio_",
+                        dir=_conversion_temp_root(),
+                    )
+                )
                 logger.debug(
                     "Created temporary directory for audio conversions: %s",
                     temp_dir,
                 )
 
             output_path = _make_output_path(temp_dir, Path(original_path), idx)
-            _ffmpeg_convert(original_path, output_path)
-            logger.info(
-                "Converted audio '%s' -> '%s' (mono %dkHz, 16-bit)",
-                original_path,
-                output_path,
-                TARGET_SAMPLE_RATE // 1000,
-            )
+            jobs.append((original_path, output_path))
             processed.append(str(output_path))
 
+        if jobs:
+            # Each ffmpeg invocation is independent and blocks in a
+            # subprocess wait, so a thread pool gets real parallelism;
+            # pool.map raises the first conversion failure, matching the
+            # serial loop's fail-fast behaviour.
+            want_pcm = capture is not None
+            pcm_blobs = list(
+                _conversion_pool().map(
+                    lambda job: _convert_file(*job, capture_pcm=want_pcm),
+                    jobs,
+                )
+            )
+            for (original_path, output_path), pcm in zip(jobs, pcm_blobs):
+                if capture is not None and pcm:
+                    capture.buffers[str(output_path)] = np.frombuffer(
+                        pcm, dtype=np.int16
+                    )
+                logger.info(
+                    "Converted audio '%s' -> '%s' (mono %dkHz, 16-bit)",
+                    original_path,
+                    output_path,
+                    TARGET_SAMPLE_RATE // 1000,
+                )
+
         yield processed
     finally:
         if temp_dir is not None:
@@ -188,8 +422,110 @@ def prepare_audio_files(paths: Sequence[str]) -> Iterator[list[str]]:
             logger.debug("Removed temporary audio directory: %s", temp_dir)
 
 
+@dataclass
+class DecodedAudioCache:
+    """In-memory PCM buffers shared by the transcription and diarization stages.
+
+    Keyed by prepared path so both passes over the same inputs decode each
+    WAV exactly once. Buffers are float32 mono at ``TARGET_SAMPLE_RATE``;
+    large files are backed by ``np.memmap`` views to keep RSS bounded.
+    """
+
+    buffers: dict[str, np.ndarray] = field(default_factory=dict)
+    sample_rate: int = TARGET_SAMPLE_RATE
+
+    @property
+    def paths(self) -> list[str]:
+        return list(self.buffers.keys())
+
+    def get(self, path: str) -> np.ndarray:
+        return self.buffers[path]
+
+    def signals(self, paths: Sequence[str] | None = None) -> list[np.ndarray]:
+        """Return float32 signals for ``paths`` (cache order by default)."""
+        selected = self.paths if paths is None else list(paths)
+        return [
+            np.asarray(self.buffers[p], dtype=np.float32) / 32768.0
+            for p in selected
+        ]
+
+
+def _wav_data_offset(path: str) -> tuple[int, int] | None:
+    """Return (byte offset, size) of the RIFF ``data`` chunk payload."""
+    with open(path, "rb") as handle:
+        header = handle.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            return None
+        offset = 12
+        while True:
+            chunk_header = handle.read(8)
+            if len(chunk_header) < 8:
+                return None
+            chunk_id = chunk_header[:4]
+            chunk_size = int.from_bytes(chunk_header[4:8], "little")
+            offset += 8
+            if chunk_id == b"data":
+                return offset, chunk_size
+            # Chunks are word-aligned.
+            skip = chunk_size + (chunk_size & 1)
+            handle.seek(skip, os.SEEK_CUR)
+            offset += skip
+
+
+def _decode_wav(path: str) -> np.ndarray:
+    """Decode one prepared WAV into int16 samples, mmapping large files."""
+    file_size = os.path.getsize(path)
+    if file_size > DECODE_MEMMAP_THRESHOLD_BYTES:
+        located = _wav_data_offset(path)
+        if located is not None:
+            data_offset, data_size = located
+            # Map exactly the data chunk: trailing RIFF chunks after it
+            # must not be decoded as audio, a truncated file must not
+            # map past EOF, and an odd byte count would make an
+            # unbounded memmap raise.
+            usable = min(data_size, file_size - data_offset)
+            if usable >= 2:
+                return np.memmap(
+                    path,
+                    dtype=np.int16,
+                    mode="r",
+                    offset=data_offset,
+                    shape=(usable // 2,),
+                )
+    with wave.open(path, "rb") as wav:
+        frames = wav.readframes(wav.getnframes())
+    return np.frombuffer(frames, dtype=np.int16)
+
+
+def decode_all(
+    paths: Sequence[str],
+    cache: DecodedAudioCache | None = None,
+) -> DecodedAudioCache:
+    """Decode every prepared WAV once so later stages skip redundant reads.
+
+    Paths already present in ``cache`` (e.g. PCM captured while
+    converting) are kept as-is and not re-read.
+    """
+    if cache is None:
+        cache = DecodedAudioCache()
+    for path in paths:
+        if path in cache.buffers:
+            continue
+        try:
+            cache.buffers[path] = _decode_wav(path)
+        except (OSError, ValueError, EOFError, wave.Error) as exc:
+            # wave raises EOFError on truncated files and numpy raises
+            # ValueError on malformed sizes; a skipped file just falls
+            # back to the path-based decode in the model.
+            logger.warning("Unable to pre-decode %s: %s", path, exc)
+    return cache
+
+
 __all__ = [
     "prepare_audio_files",
+    "DecodedAudioCache",
+    "decode_all",
+    "DECODE_MEMMAP_THRESHOLD_BYTES",
     "TARGET_SAMPLE_RATE",
     "TARGET_CHANNELS",
     "TARGET_SAMPLE_WIDTH",
@@ -1,58 +1,225 @@
+from __future__ import annotations
+
+import contextlib
+import functools
 import os
 import sys
-from typing import Any
+import threading
+from typing import TYPE_CHECKING, Any
 
-import static_ffmpeg
-from static_ffmpeg import run  # noqa: F401
-from pydub import AudioSegment  # noqa: F401
-from nemo.collections.asr.models import ASRModel
+if TYPE_CHECKING:  # pragma: no cover - heavy imports for type checkers only
+    from nemo.collections.asr.models import ASRModel
 
-from Transcription_parakeet.Src.model.model_cache import find_local_checkpoint
+from Transcription_parakeet.Src.model.model_cache import (
+    clear_checkpoint_cache,
+    default_output_dir,
+    find_local_checkpoint,
+    safe_model_filename,
+)
 from Transcription_parakeet.config.logger_config import logger
 
 
-# Option A: add to PATH for the current process
-static_ffmpeg.add_paths()  # downloads ffmpeg+ffprobe on first call
+@functools.lru_cache(maxsize=1)
+def _configure_ffmpeg() -> None:
+    """Expose static_ffmpeg's binaries on PATH for subprocess users.
+
+    Runs once per process; ``add_paths`` downloads the binaries on the
+    very first call only. Imported lazily so merely importing this
+    module stays cheap.
+    """
+    import static_ffmpeg
+
+    static_ffmpeg.add_paths()
 
-# Option B: get explicit paths and set pydub
-# ffmpeg_path, ffprobe_path = (
-#     run.get_or_fetch_platform_executables_else_raise()
-# )
-# AudioSegment.converter = ffmpeg_path
-# AudioSegment.ffprobe = ffprobe_path
 
 DEFAULT_PARAKEET_MODEL = "nvidia/parakeet-tdt-0.6b-v2"
 
 
 def validate_paths(paths: list[str]) -> list[str]:
-    """Return existing paths from the provided list."""
+    """Return existing paths from the provided list.
+
+    Every returned path is guaranteed to exist at call time; callers can
+    rely on this instead of re-checking with ``os.path.exists``.
+
+    Directories holding several inputs are listed once with
+    ``os.scandir`` and checked by name membership, replacing one stat
+    syscall per path with one directory read per parent.
+    """
+    by_dir: dict[str, int] = {}
+    for pth in paths:
+        directory = os.path.dirname(pth) or "."
+        by_dir[directory] = by_dir.get(directory, 0) + 1
+
+    names_by_dir: dict[str, set[str] | None] = {}
+    for directory, count in by_dir.items():
+        names: set[str] | None = None
+        if count > 1:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                names = None
+        names_by_dir[directory] = names
+
     files: list[str] = []
     for pth in paths:
-        if not os.path.exists(pth):
+        names = names_by_dir[os.path.dirname(pth) or "."]
+        if names is not None:
+            exists = os.path.basename(pth) in names
+        else:
+            exists = os.path.exists(pth)
+        if not exists:
             logger.warning("path not found: %s", pth)
         else:
             files.append(pth)
     return files
 
 
-def load_model(model_name: str = DEFAULT_PARAKEET_MODEL) -> ASRModel:
-    """Load and return the NeMo ASR model."""
+# Serializes model loads so concurrent first requests share one
+# restore instead of racing duplicate multi-GB initializations.
+_MODEL_LOCK = threading.Lock()
+
+
+def _prepare_for_inference(model: ASRModel) -> ASRModel:
+    """Put a freshly loaded model in its steady inference state.
+
+    Moving to the GPU here means the one-time H2D weight copy happens at
+    load rather than silently inside the first transcribe call, and
+    ``freeze`` drops gradient state NeMo would otherwise keep around.
+    """
+    import torch
+
+    model.eval()
+    if torch.cuda.is_available():
+        model = model.cuda()
+        if hasattr(model, "freeze"):
+            model.freeze()
+    return model
+
+
+def _inference_ctx() -> contextlib.ExitStack:
+    """Context for transcription: inference_mode plus CUDA autocast.
+
+    inference_mode drops autograd bookkeeping entirely; on CUDA,
+    autocast runs matmuls in bf16 (fp16 pre-Ampere) to halve the memory
+    traffic of the decoder while keeping the fp32 weights intact.
+    """
+    import torch
+
+    stack = contextlib.ExitStack()
+    stack.enter_context(torch.inference_mode())
+    if torch.cuda.is_available():
+        dtype = (
+            torch.bfloat16
+            if torch.cuda.is_bf16_supported()
+            else torch.float16
+        )
+        stack.enter_context(torch.autocast("cuda", dtype=dtype))
+    return stack
+
+
+@functools.lru_cache(maxsize=4)
+def _load_model_cached(model_name: str) -> ASRModel:
+    # NeMo pulls in PyTorch and hundreds of submodules; defer that cost
+    # to the first model load instead of paying it at import time.
+    from nemo.collections.asr.models import ASRModel
+
+    _configure_ffmpeg()
     logger.info("Looking for a local .nemo model for %s", model_name)
     local = find_local_checkpoint(model_name)
     if local is not None:
         logger.info("Loading model from local file %s", local)
-        return ASRModel.restore_from(restore_path=str(local))
+        return _prepare_for_inference(
+            ASRModel.restore_from(restore_path=str(local))
+        )
 
     logger.info("Falling back to ASRModel.from_pretrained(%s)", model_name)
-    return ASRModel.from_pretrained(model_name)
+    model = ASRModel.from_pretrained(model_name)
+    # Persist the freshly downloaded model in-process so the next cold
+    # start restores it locally. The instance already in memory is
+    # returned as-is — no round trip back through restore_from.
+    out_path = default_output_dir() / safe_model_filename(model_name)
+    if not out_path.exists():
+        try:
+            model.save_to(str(out_path))
+            clear_checkpoint_cache()
+            logger.info("Cached pretrained model at %s", out_path)
+        except Exception:  # pragma: no cover - cache is best effort
+            logger.warning("Could not cache model to %s", out_path)
+    return _prepare_for_inference(model)
+
+
+def load_model(model_name: str = DEFAULT_PARAKEET_MODEL) -> ASRModel:
+    """Load and return the NeMo ASR model.
+
+    Instances are memoized per model name, so repeated calls (one per
+    request in server mode) reuse the already-initialized model instead
+    of re-reading the checkpoint.
+    """
+    with _MODEL_LOCK:
+        return _load_model_cached(model_name)
+
+
+def clear_model_cache() -> None:
+    """Drop memoized model instances (intended for tests)."""
+    _load_model_cached.cache_clear()
+
+
+def _effective_batch_size(batch_size: int, count: int) -> int:
+    """Widen the default batch size when several files arrive together.
+
+    A caller-provided batch size (anything but the default 1) is always
+    respected. For multi-file calls left at the default, batching up to
+    16 on GPU (4 on CPU, PARAKEET_BATCH_SIZE overrides) shares kernel
+    launches across files instead of serializing full passes.
+    """
+    if batch_size != 1 or count <= 1:
+        return batch_size
+    import torch
+
+    cap = int(os.environ.get("PARAKEET_BATCH_SIZE", "0"))
+    if cap <= 0:
+        cap = 16 if torch.cuda.is_available() else 4
+    return min(count, cap)
 
 
 def transcribe_files(model: ASRModel, files: list[str], batch_size: int = 1):
     """Transcribe files with the given model and return results."""
+    batch_size = _effective_batch_size(batch_size, len(files))
     logger.info("Transcribing %d file(s)...", len(files))
-    return model.transcribe(
-        files, batch_size=batch_size, return_hypotheses=True, timestamps=True
-    )
+    with _inference_ctx():
+        return model.transcribe(
+            files,
+            batch_size=batch_size,
+            return_hypotheses=True,
+            timestamps=True,
+        )
+
+
+def transcribe_files_cached(
+    model: ASRModel,
+    cache: Any,
+    batch_size: int = 1,
+    *,
+    paths: list[str] | None = None,
+):
+    """Transcribe from a ``DecodedAudioCache`` instead of re-reading WAVs.
+
+    The cache holds PCM decoded once by the preprocessing stage, so this
+    avoids a second disk read per file when diarization runs on the same
+    inputs. Pass ``paths`` to pin the signal order to a specific file
+    list; the cache's insertion order need not match it.
+    """
+    signals = cache.signals(paths)
+    batch_size = _effective_batch_size(batch_size, len(signals))
+    logger.info("Transcribing %d pre-decoded file(s)...", len(signals))
+    with _inference_ctx():
+        return model.transcribe(
+            signals,
+            batch_size=batch_size,
+            return_hypotheses=True,
+            timestamps=True,
+        )
 
 
 def _result_to_dict(file_path: str, result: Any) -> dict:
@@ -69,13 +236,17 @@ def _result_to_dict(file_path: str, result: Any) -> dict:
     text = getattr(result, "text", "")
     # Some NeMo result objects may include confidence/score
     score = getattr(result, "score", None)
-    timestamps = getattr(result, "timestamp", None)
-    # If timestamps is not serializable, attempt to coerce
-    try:
-        if timestamps is not None:
-            # convert mapping-like timestamp to a plain dict if possible
-            timestamps = dict(timestamps)
-    except Exception:
+    ts = getattr(result, "timestamp", None)
+    # Parakeet results carry a plain dict already — pass it through and
+    # only coerce other mapping-like shapes, skipping a copy per result.
+    if isinstance(ts, dict):
+        timestamps = ts
+    elif hasattr(ts, "keys"):
+        try:
+            timestamps = dict(ts)
+        except Exception:
+            timestamps = None
+    else:
         timestamps = None
     return {
         "file": file_path,
@@ -11,6 +11,7 @@ if TYPE_CHECKING:  # pragma: no cover - import-time guard for type checkers
         main,
         print_results,
         transcribe_files,
+        transcribe_files_cached,
         validate_paths,
         load_model,
     )
@@ -19,6 +20,7 @@ __all__ = [
     "validate_paths",
     "load_model",
     "transcribe_files",
+    "transcribe_files_cached",
     "print_results",
     "main",
     "Parakeet",
@@ -1,8 +1,21 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+import queue
 import time
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 from pathlib import Path
 
+# Skip the per-record thread/process/multiprocessing lookups; none of
+# the formatters below use those fields on hot paths.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 
 class Logger:
     def __init__(
@@ -20,20 +33,24 @@ class Logger:
             self.logger.removeHandler(handler)
 
         self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+
+        handlers = []
 
         # Console handler
-        self._add_handler(
+        handlers.append(self._make_handler(
             logging.StreamHandler(),
             console_level,
             logging.Formatter("%(message)s")
-        )
+        ))
 
-        # Detailed log file handler
+        # Detailed log file handler. %(filename)s/%(lineno)d/%(funcName)s
+        # force a stack walk per record, so they live only on the
+        # error handler below where volume is low.
         detailed_formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - "
-            "[%(filename)s:%(lineno)d] - %(funcName)s - %(message)s"
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
-        self._add_handler(
+        handlers.append(self._make_handler(
             RotatingFileHandler(
                 f"{log_dir}/detailed_logs.log",
                 maxBytes=10*1024*1024,
@@ -41,7 +58,7 @@ class Logger:
             ),
             file_level,
             detailed_formatter
-        )
+        ))
 
         # Daily processing log handler
         proc_handler = TimedRotatingFileHandler(
@@ -51,18 +68,18 @@ class Logger:
             encoding="utf-8"
         )
         proc_handler.suffix = "%Y-%m-%d"
-        self._add_handler(
+        handlers.append(self._make_handler(
             proc_handler,
             logging.INFO,
             logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        )
+        ))
 
         # Error log handler
         error_formatter = logging.Formatter(
-            "%(asctime)s - %(process)d - %(levelname)s - "
-            "[%(filename)s:%(lineno)d] - %(message)s"
+            "%(asctime)s - %(levelname)s - "
+            "[%(filename)s:%(lineno)d] - %(funcName)s - %(message)s"
         )
-        self._add_handler(
+        handlers.append(self._make_handler(
             RotatingFileHandler(
                 f"{log_dir}/errors.log",
                 maxBytes=5*1024*1024,
@@ -70,17 +87,28 @@ class Logger:
             ),
             logging.ERROR,
             error_formatter
+        ))
+
+        # One QueueHandler on the logger; formatting and file I/O run on
+        # the listener thread so callers never block on disk writes.
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(QueueHandler(log_queue))
+        self._listener = QueueListener(
+            log_queue, *handlers, respect_handler_level=True
         )
+        self._listener.start()
+        atexit.register(self._listener.stop)
 
         self.logger.info(
             "Logger initialized at %s",
             time.strftime("%Y-%m-%d %H:%M:%S")
         )
 
-    def _add_handler(self, handler, level, formatter):
+    @staticmethod
+    def _make_handler(handler, level, formatter):
         handler.setLevel(level)
         handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        return handler
 
 
 logger = Logger().logger